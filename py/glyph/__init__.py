@@ -50,6 +50,7 @@ from .loose import (
     canonicalize_loose,
     canonicalize_loose_no_tabular,
     fingerprint_loose,
+    fingerprint_loose_batch,
     equal_loose,
     # Options
     LooseCanonOpts,
@@ -118,6 +119,7 @@ __all__ = [
     "canonicalize_loose",
     "canonicalize_loose_no_tabular",
     "fingerprint_loose",
+    "fingerprint_loose_batch",
     "equal_loose",
     # Options
     "LooseCanonOpts",
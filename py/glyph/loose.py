@@ -23,15 +23,23 @@ Auto-Tabular:
 
 from __future__ import annotations
 import base64
+import functools
 import hashlib
 import math
+import re
 from dataclasses import dataclass, field as dataclass_field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from .types import GValue, GType, MapEntry, RefID
 
+try:
+    import orjson as _orjson  # optional: faster JSON decoding
+except ImportError:
+    _orjson = None  # type: ignore
+
 
 # ============================================================
 # Options
@@ -77,12 +85,30 @@ def no_tabular_loose_canon_opts() -> LooseCanonOpts:
 
 NULL_SYMBOL = "∅"
 NULL_UNDERSCORE = "_"
+_NULL_STR = {NullStyle.SYMBOL: NULL_SYMBOL, NullStyle.UNDERSCORE: NULL_UNDERSCORE}
+
+# Decimal strings for the small ints that dominate counts, indices and flags.
+_SMALL_INT_STR = tuple(str(i) for i in range(-128, 513))
 
 # Security limits (Class 5: Resource Exhaustion)
 MAX_JSON_DEPTH = 128
 MAX_COLLECTION_LEN = 1_000_000  # 1M elements
 MAX_STRING_LEN = 10 * 1024 * 1024  # 10MB
 
+# Strings up to this length go through the canon_string memo cache.
+_CANON_CACHE_MAX_LEN = 64
+
+# Tokens buffered by _emit before handing them to a flush callback.
+_FLUSH_TOKENS = 4096
+
+# Maps/structs with at least this many entries cache their sorted key order.
+_KEY_ORDER_CACHE_MIN = 8
+
+# Bounds on _shared_key's table: keys up to this length are shared, and the
+# table is cleared once it holds this many.
+_SHARED_KEY_MAX_LEN = 64
+_SHARED_KEYS_MAX = 4096
+
 # IEEE-754 double safe-integer bound (2^53 - 1). GLYPH-Loose uses JSON-domain
 # (double) number semantics so canonical output is byte-identical across Go, JS,
 # and Python: integers within this window are integer literals; anything outside
@@ -90,8 +116,25 @@ MAX_STRING_LEN = 10 * 1024 * 1024  # 10MB
 MAX_SAFE_INT = (1 << 53) - 1  # 9007199254740991
 
 # Reserved words that must be quoted (D8: matches Go isValidBareString reject list)
-RESERVED_WORDS = {"t", "f", "true", "false", "null", "none", "nil", "_", "NaN", "Inf",
-                   "struct", "sum", "list", "map"}
+RESERVED_WORDS = frozenset({"t", "f", "true", "false", "null", "none", "nil", "_", "NaN", "Inf",
+                            "struct", "sum", "list", "map"})
+
+# Bare-string (D8) and ref-part (D7) character rules, ASCII only.
+_BARE_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_ID_RE = re.compile(r'[A-Za-z0-9_.\-]+')
+
+
+# Escape table for quoted strings: the named escapes plus \uXXXX for the
+# remaining C0 control characters. str.translate applies it in one C-level pass.
+_ESCAPE_TABLE = {
+    ord('"'): '\\"',
+    ord('\\'): '\\\\',
+    ord('\n'): '\\n',
+    ord('\r'): '\\r',
+    ord('\t'): '\\t',
+    **{i: f"\\u{i:04x}" for i in range(32) if i not in (9, 10, 13)},
+}
+_UNSAFE_RE = re.compile(r'[\x00-\x1f"\\]')
 
 
 # ============================================================
@@ -100,9 +143,7 @@ RESERVED_WORDS = {"t", "f", "true", "false", "null", "none", "nil", "_", "NaN",
 
 def canon_null(style: NullStyle = NullStyle.UNDERSCORE) -> str:
     """Canonicalize null."""
-    if style == NullStyle.UNDERSCORE:
-        return NULL_UNDERSCORE
-    return NULL_SYMBOL
+    return _NULL_STR.get(style, NULL_SYMBOL)
 
 
 def canon_bool(v: bool) -> str:
@@ -112,8 +153,8 @@ def canon_bool(v: bool) -> str:
 
 def canon_int(n: int) -> str:
     """Canonicalize integer."""
-    if n == 0:
-        return "0"
+    if -128 <= n <= 512:
+        return _SMALL_INT_STR[n + 128]
     return str(n)
 
 
@@ -137,63 +178,25 @@ def canon_float(f: float) -> str:
     if f == 0.0:
         return "0.0"
 
-    neg = math.copysign(1.0, f) < 0
-    abs_f = abs(f)
-
     # repr() gives the shortest round-trip decimal string in Python 3.1+.
-    r = repr(abs_f)
-
+    # Shortest digits round back to f itself, so comparing f against the
+    # exactly-representable bounds decides E without inspecting the digits.
+    r = repr(f)
+    a = -f if f < 0 else f
+    if 1e-4 <= a < 1e6:
+        # Both Go and Python use decimal form (repr always has a '.').
+        return r
     if 'e' in r:
-        # Python already chose exponential (e.g. "1e-05", "1.5e-10").
-        # Go also uses exponential here — just reformat the exponent sign/padding.
-        mant_str, exp_str = r.split('e')
-        py_exp = int(exp_str)
-        # Re-emit with Go-style exponent: e+06, e-05
-        abs_exp = abs(py_exp)
-        sign_char = '+' if py_exp >= 0 else '-'
-        s = f"{mant_str}e{sign_char}{abs_exp:02d}"
-    else:
-        # Python gave decimal form. Compute the magnitude exponent E EXACTLY from
-        # the decimal digits — math.log10 rounds the wrong way for values just
-        # below a power of ten (e.g. repr 999999999999999.8 -> true E is 14, but
-        # math.log10 yields 15.0), which would diverge from Go/JS.
-        if '.' in r:
-            _int_p, _frac_p = r.split('.')
-        else:
-            _int_p, _frac_p = r, ''
-        if _int_p != '0':
-            E = len(_int_p) - 1
-        else:
-            _stripped = _frac_p.lstrip('0')
-            E = -(len(_frac_p) - len(_stripped)) - 1
-        if E >= 6 or E <= -5:
-            # Go uses exponential; Python used decimal.
-            # Extract significant digits from Python's repr.
-            if '.' in r:
-                int_p, frac_p = r.split('.')
-                if int_p == '0':
-                    all_digits = frac_p.lstrip('0').rstrip('0') or '0'
-                else:
-                    all_digits = (int_p + frac_p).rstrip('0') or '0'
-            else:
-                all_digits = r.rstrip('0') or '0'
-
-            if len(all_digits) == 1:
-                mant = all_digits
-            else:
-                mant = all_digits[0] + '.' + all_digits[1:]
+        # Python already chose exponential (|f| < 1e-4 or >= 1e16) and its
+        # exponent is already Go-style: signed, at least two digits.
+        return r
 
-            abs_exp = abs(E)
-            sign_char = '+' if E >= 0 else '-'
-            s = f"{mant}e{sign_char}{abs_exp:02d}"
-        else:
-            # Go uses decimal; Python's repr is already correct.
-            s = r
-            # D4: ensure decimal point so token is unambiguously float.
-            if '.' not in s and 'e' not in s:
-                s += '.0'
-
-    return ('-' if neg else '') + s
+    # 1e6 <= |f| < 1e16: Go uses exponential; Python used decimal.
+    sign = '-' if f < 0 else ''
+    int_p, frac_p = r.lstrip('-').split('.')
+    digits = (int_p + frac_p).rstrip('0')
+    mant = digits if len(digits) == 1 else digits[0] + '.' + digits[1:]
+    return f"{sign}{mant}e+{len(int_p) - 1:02d}"
 
 
 def is_bare_safe(s: str) -> bool:
@@ -203,49 +206,35 @@ def is_bare_safe(s: str) -> bool:
     not a reserved keyword.  Unicode characters, '-', '.', '/' and any other
     non-ASCII/non-alnum-underscore byte force quoting.
     """
-    if not s:
-        return False
-    if s in RESERVED_WORDS:
-        return False
-
-    first = s[0]
-    if not (first == "_" or ("A" <= first <= "Z") or ("a" <= first <= "z")):
-        return False
-
-    for c in s[1:]:
-        if not (("A" <= c <= "Z") or ("a" <= c <= "z") or ("0" <= c <= "9") or c == "_"):
-            return False
-    return True
+    return bool(s) and s not in RESERVED_WORDS and _BARE_RE.fullmatch(s) is not None
 
 
 def escape_string(s: str) -> str:
     """Escape a string for GLYPH output."""
-    result = []
-    for c in s:
-        if c == '"':
-            result.append('\\"')
-        elif c == '\\':
-            result.append('\\\\')
-        elif c == '\n':
-            result.append('\\n')
-        elif c == '\r':
-            result.append('\\r')
-        elif c == '\t':
-            result.append('\\t')
-        elif ord(c) < 32:
-            result.append(f"\\u{ord(c):04x}")
-        else:
-            result.append(c)
-    return ''.join(result)
+    if _UNSAFE_RE.search(s) is None:
+        return s
+    return s.translate(_ESCAPE_TABLE)
 
 
 def canon_string(s: str) -> str:
     """Canonicalize string."""
+    if len(s) <= _CANON_CACHE_MAX_LEN:
+        return _canon_string_cached(s)
+    return _canon_string(s)
+
+
+def _canon_string(s: str) -> str:
     if is_bare_safe(s):
         return s
     return f'"{escape_string(s)}"'
 
 
+# Map keys, struct field names and tabular column names form a small working
+# set that is canonicalized over and over; memoize them. Long strings bypass
+# the cache so it never pins large payload values in memory.
+_canon_string_cached = functools.lru_cache(maxsize=8192)(_canon_string)
+
+
 def canon_bytes(b: bytes) -> str:
     """Canonicalize bytes as base64."""
     encoded = base64.b64encode(b).decode('ascii')
@@ -254,16 +243,15 @@ def canon_bytes(b: bytes) -> str:
 
 def canon_time(t: datetime) -> str:
     """Canonicalize datetime as ISO-8601 UTC."""
-    if t.tzinfo is None:
-        # Assume UTC if no timezone
-        t = t.replace(tzinfo=timezone.utc)
-    utc = t.astimezone(timezone.utc)
+    # Naive datetimes are taken as UTC; aware ones are converted unless they
+    # already are UTC.
+    if t.tzinfo is not None and t.tzinfo is not timezone.utc:
+        t = t.astimezone(timezone.utc)
     # Format: 2025-01-13T12:34:56Z
-    s = utc.strftime("%Y-%m-%dT%H:%M:%S")
-    if utc.microsecond:
+    s = f"{t.year:04d}-{t.month:02d}-{t.day:02d}T{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+    if t.microsecond:
         # Add fractional seconds, removing trailing zeros
-        frac = f".{utc.microsecond:06d}".rstrip("0")
-        s += frac
+        s += f".{t.microsecond:06d}".rstrip("0")
     return s + "Z"
 
 
@@ -274,13 +262,7 @@ def is_id_safe(s: str) -> bool:
     '/' and all non-ASCII bytes are rejected — the Go typed lexer's isRefChar
     does not include '/' (token.go:581-583).
     """
-    if not s:
-        return False
-    for c in s:
-        if not (("A" <= c <= "Z") or ("a" <= c <= "z") or ("0" <= c <= "9")
-                or c == "_" or c == "-" or c == "."):
-            return False
-    return True
+    return _ID_RE.fullmatch(s) is not None
 
 
 def canon_id(ref: RefID) -> str:
@@ -321,41 +303,60 @@ def canonicalize_loose_no_tabular(v: GValue) -> str:
 
 
 def _canonicalize_value(v: GValue, opts: LooseCanonOpts) -> str:
-    """Internal canonicalization dispatcher."""
-    t = v.type
+    """Internal canonicalization entry point for a single value."""
+    out: List[str] = []
+    _emit(v, opts, out)
+    return "".join(out)
 
-    if t == GType.NULL:
-        return canon_null(opts.null_style)
-    elif t == GType.BOOL:
-        return canon_bool(v.as_bool())
-    elif t == GType.INT:
-        return canon_int(v.as_int())
-    elif t == GType.FLOAT:
-        return canon_float(v.as_float())
-    elif t == GType.STR:
-        return canon_string(v.as_str())
-    elif t == GType.BYTES:
-        return canon_bytes(v.as_bytes())
-    elif t == GType.TIME:
-        return canon_time(v.as_time())
-    elif t == GType.ID:
-        return canon_id(v.as_id())
-    elif t == GType.LIST:
-        return _canonicalize_list(v.as_list(), opts)
-    elif t == GType.MAP:
-        return _canonicalize_map(v.as_map(), opts)
-    elif t == GType.STRUCT:
-        sv = v.as_struct()
-        return _canonicalize_struct(sv.type_name, sv.fields, opts)
-    elif t == GType.SUM:
-        sm = v.as_sum()
-        return _canonicalize_sum(sm.tag, sm.value, opts)
 
-    raise ValueError(f"unknown type: {t}")
+def _emit(root: GValue, opts: LooseCanonOpts, out: List[str],
+          flush: Optional[Callable[[List[str]], None]] = None) -> None:
+    """Append the canonical tokens of root, in order, to out.
 
+    Iterative rather than recursive: a container writes its opening token and
+    pushes its closing token, children and separators onto an explicit stack
+    in reverse order, so nesting costs no Python call frames. Plain str items
+    on the stack are literal tokens.
 
-def _canonicalize_list(items: List[GValue], opts: LooseCanonOpts) -> str:
-    """Canonicalize a list, possibly as tabular."""
+    If flush is given, it is called with out (and must empty it) whenever
+    out holds _FLUSH_TOKENS tokens or more, so a consumer such as a hash can
+    take the output in chunks without the whole string ever existing. The
+    caller handles whatever is left in out at the end.
+    """
+    write = out.append
+    stack: List[Any] = [root]
+    push = stack.append
+    pop = stack.pop
+    scalars = _DISPATCH
+    containers = _CONTAINERS
+    while stack:
+        item = pop()
+        if item.__class__ is str:
+            write(item)
+            if flush is not None and len(out) >= _FLUSH_TOKENS:
+                flush(out)
+            continue
+        t = item.type
+        encode = scalars.get(t)
+        if encode is not None:
+            write(encode(item, opts))
+            continue
+        try:
+            open_container = containers[t]
+        except KeyError:
+            raise ValueError(f"unknown type: {t}") from None
+        write(open_container(item, opts, push))
+
+
+def _open_list(v: GValue, opts: LooseCanonOpts, push: Callable[[Any], None]) -> str:
+    """Open a list, possibly emitting it whole as tabular."""
+    records = v.columnar()
+    if records is not None and opts.auto_tabular:
+        columns, values = records
+        if 0 < len(columns) <= opts.max_cols and opts.min_rows <= len(values[0]):
+            return _columnar_tabular(columns, values, opts)
+
+    items = v.as_list()
     if not items:
         return "[]"
 
@@ -365,52 +366,168 @@ def _canonicalize_list(items: List[GValue], opts: LooseCanonOpts) -> str:
         if tabular:
             return tabular
 
-    # Standard list format
-    parts = [_canonicalize_value(item, opts) for item in items]
-    return "[" + " ".join(parts) + "]"
-
-
-def _canonicalize_map(entries: List[MapEntry], opts: LooseCanonOpts) -> str:
-    """Canonicalize a map with sorted keys."""
+    # Standard list format. A run of leading scalars (all of a numeric
+    # array, say) is encoded here and joined in one piece rather than going
+    # through the stack element by element.
+    get = _DISPATCH.get
+    parts = []
+    for item in items:
+        encode = get(item.type)
+        if encode is None:
+            break
+        parts.append(encode(item, opts))
+    else:
+        return "[" + " ".join(parts) + "]"
+
+    push("]")
+    start = len(parts)
+    for i in range(len(items) - 1, start, -1):
+        push(items[i])
+        push(" ")
+    push(items[start])
+    if parts:
+        push(" ")
+        push(" ".join(parts))
+    return "["
+
+
+def _open_map(v: GValue, opts: LooseCanonOpts, push: Callable[[Any], None]) -> str:
+    """Open a map; entries follow in sorted key order."""
+    entries = v.as_map()
     if not entries:
         return "{}"
+    push("}")
+    _push_entries(entries, push, v)
+    return "{"
+
+
+def _open_struct(v: GValue, opts: LooseCanonOpts, push: Callable[[Any], None]) -> str:
+    """Open a struct; fields follow in sorted key order."""
+    sv = v.as_struct()
+    if not sv.fields:
+        return f"{sv.type_name}{{}}"
+    push("}")
+    _push_entries(sv.fields, push, v)
+    return f"{sv.type_name}{{"
+
+
+def _open_sum(v: GValue, opts: LooseCanonOpts, push: Callable[[Any], None]) -> str:
+    """Open a sum (tagged union)."""
+    sm = v.as_sum()
+    tag_str = canon_string(sm.tag)
+    if sm.value is None:
+        return f"{tag_str}()"
+    push(")")
+    push(sm.value)
+    return f"{tag_str}("
 
-    # Sort by canonical key
-    sorted_entries = sorted(entries, key=lambda e: canon_string(e.key).encode('utf-8'))
 
-    parts = []
-    for e in sorted_entries:
-        key_str = canon_string(e.key)
-        val_str = _canonicalize_value(e.value, opts)
-        parts.append(f"{key_str}={val_str}")
+def _open_bytes(v: GValue, opts: LooseCanonOpts, push: Callable[[Any], None]) -> str:
+    """Open a bytes literal; the base64 body is written as its own token.
 
-    return "{" + " ".join(parts) + "}"
+    This keeps a large blob's encoding out of an intermediate
+    b64"..." string: it is copied once, into the final output.
+    """
+    push('"')
+    push(base64.b64encode(v.as_bytes()).decode('ascii'))
+    return 'b64"'
 
 
-def _canonicalize_struct(type_name: str, fields: List[MapEntry], opts: LooseCanonOpts) -> str:
-    """Canonicalize a struct."""
-    if not fields:
-        return f"{type_name}{{}}"
+def _push_entries(
+    entries: List[MapEntry], push: Callable[[Any], None], owner: Optional[GValue] = None,
+) -> None:
+    """Push sorted key=value tokens, space-separated, in reverse order."""
+    if owner is not None and len(entries) >= _KEY_ORDER_CACHE_MIN:
+        decorated = _cached_canon_entries(entries, owner)
+    else:
+        decorated = _sorted_canon_entries(entries)
+    for i in range(len(decorated) - 1, -1, -1):
+        key_str, value = decorated[i]
+        push(value)
+        push("=")
+        push(key_str)
+        if i:
+            push(" ")
+
+
+def _sorted_canon_entries(entries: List[MapEntry]) -> List[Tuple[str, GValue]]:
+    """Canonicalize each key once and sort entries by it.
+
+    Keys are ordered by the bytewise UTF-8 encoding of their canonical form.
+    UTF-8 preserves code point order, so comparing the str values directly
+    gives the same order without encoding every key.
+    """
+    decorated = [(canon_string(e.key), e.value) for e in entries]
+    decorated.sort(key=itemgetter(0))
+    return decorated
 
-    # Sort fields by canonical key
-    sorted_fields = sorted(fields, key=lambda f: canon_string(f.key).encode('utf-8'))
 
-    parts = []
-    for f in sorted_fields:
-        key_str = canon_string(f.key)
-        val_str = _canonicalize_value(f.value, opts)
-        parts.append(f"{key_str}={val_str}")
+def _cached_canon_entries(entries: List[MapEntry], owner: GValue) -> List[Tuple[str, GValue]]:
+    """Like _sorted_canon_entries, reusing the key order cached on owner.
 
-    return f"{type_name}{{" + " ".join(parts) + "}"
+    The cache is keyed by the entry keys in storage order, so it stays
+    correct if entries are replaced or reordered behind the owner's back;
+    only the values are read fresh on each call.
+    """
+    keys = tuple([e.key for e in entries])
+    cached = owner._key_order
+    if cached is None or cached[0] != keys:
+        # Sort on the canonical key alone; the sort is stable, so duplicate
+        # keys keep their storage order without comparing indices.
+        order = [(canon_string(k), i) for i, k in enumerate(keys)]
+        order.sort(key=itemgetter(0))
+        cached = owner._key_order = (keys, order)
+    return [(key_str, entries[i].value) for key_str, i in cached[1]]
+
+
+def _memo_float(v: GValue, opts: LooseCanonOpts) -> str:
+    s = v._canon
+    if s is None:
+        s = v._canon = canon_float(v._float)  # type: ignore
+    return s
 
 
-def _canonicalize_sum(tag: str, value: Optional[GValue], opts: LooseCanonOpts) -> str:
-    """Canonicalize a sum (tagged union)."""
-    tag_str = canon_string(tag)
-    if value is None:
-        return f"{tag_str}()"
-    val_str = _canonicalize_value(value, opts)
-    return f"{tag_str}({val_str})"
+def _memo_string(v: GValue, opts: LooseCanonOpts) -> str:
+    s = v._canon
+    if s is None:
+        raw: str = v._str  # type: ignore
+        s = canon_string(raw)
+        # Like the canon_string cache, never pin a second copy of a long
+        # payload on the value.
+        if len(raw) <= _CANON_CACHE_MAX_LEN:
+            v._canon = s
+    return s
+
+
+def _memo_time(v: GValue, opts: LooseCanonOpts) -> str:
+    s = v._canon
+    if s is None:
+        s = v._canon = canon_time(v._time)  # type: ignore
+    return s
+
+
+# GType -> canonical encoder for scalar values. Floats, times and short
+# strings keep their canonical text on the value, so a value emitted again (a
+# shared @tab cell, a document emitted and then fingerprinted) is not
+# re-encoded.
+_DISPATCH = {
+    GType.NULL: lambda v, o: _NULL_STR.get(o.null_style, NULL_SYMBOL),
+    GType.BOOL: lambda v, o: canon_bool(v.as_bool()),
+    GType.INT: lambda v, o: canon_int(v.as_int()),
+    GType.FLOAT: _memo_float,
+    GType.STR: _memo_string,
+    GType.TIME: _memo_time,
+    GType.ID: lambda v, o: canon_id(v.as_id()),
+}
+
+# GType -> opener for container values and bytes literals (see _emit).
+_CONTAINERS = {
+    GType.LIST: _open_list,
+    GType.MAP: _open_map,
+    GType.STRUCT: _open_struct,
+    GType.SUM: _open_sum,
+    GType.BYTES: _open_bytes,
+}
 
 
 # ============================================================
@@ -422,37 +539,38 @@ def _try_tabular(items: List[GValue], opts: LooseCanonOpts) -> Optional[str]:
     if len(items) < opts.min_rows:
         return None
 
-    # Check if all items are maps or structs
+    # Single pass: build each row's key->value dict (last write wins) and
+    # fold its keys into the union/common sets; the rows are reused below.
+    rows: List[Dict[str, GValue]] = []
     union_keys: Set[str] = set()
     common_keys: Optional[Set[str]] = None
-    first_keys: Optional[Set[str]] = None
+    first_keys = None
 
     for item in items:
         if item.type == GType.MAP:
-            item_keys = {e.key for e in item.as_map()}
+            entries = {e.key: e.value for e in item.as_map()}
         elif item.type == GType.STRUCT:
-            item_keys = {f.key for f in item.as_struct().fields}
+            entries = {f.key: f.value for f in item.as_struct().fields}
         else:
             return None  # Not eligible
 
-        if len(item_keys) == 0:
+        if not entries:
             return None
 
-        union_keys |= item_keys
-
+        item_keys = entries.keys()
         if first_keys is None:
-            first_keys = set(item_keys)
-        elif not opts.allow_missing:
-            if first_keys != item_keys:
-                return None  # Keys don't match
-
-        if common_keys is None:
+            first_keys = item_keys
+            union_keys.update(item_keys)
             common_keys = set(item_keys)
-        else:
-            common_keys &= item_keys
+        elif item_keys != first_keys:
+            if not opts.allow_missing:
+                return None  # Keys don't match
+            union_keys.update(item_keys)
+            common_keys &= item_keys  # type: ignore[operator]
+        # A row with the first row's key set (the usual case) leaves the
+        # union and the common keys as they are.
 
-    if len(union_keys) == 0:
-        return None
+        rows.append(entries)
 
     if len(union_keys) > opts.max_cols:
         return None
@@ -463,36 +581,22 @@ def _try_tabular(items: List[GValue], opts: LooseCanonOpts) -> Optional[str]:
             return None
 
     # Use union keys for columns
-    keys_set = union_keys
-
-    # Sort columns
-    cols = sorted(keys_set, key=lambda k: canon_string(k).encode('utf-8'))
+    cols = sorted(union_keys, key=canon_string)
 
     # Build tabular output
-    lines = []
-
-    # Header: @tab _ rows=N cols=M [col1 col2 col3]
-    # The rows/cols metadata (v2.4.0, for streaming resync) is part of the
-    # canonical form across Go and JS; Go is the source of truth, so Python
-    # emits it too. parse() / parse_loose() tolerate its absence.
-    col_header = " ".join(canon_string(c) for c in cols)
-    lines.append(f"@tab _ rows={len(items)} cols={len(cols)} [{col_header}]")
+    lines = [_tabular_header(cols, len(items))]
 
     # Rows
-    for item in items:
-        if item.type == GType.MAP:
-            entries = {e.key: e.value for e in item.as_map()}
-        else:
-            entries = {f.key: f.value for f in item.as_struct().fields}
-
+    null_cell = _NULL_STR.get(opts.null_style, NULL_SYMBOL)
+    for entries in rows:
         row_parts = []
         for col in cols:
             if col in entries:
-                cell = _canonicalize_value(entries[col], opts)
+                cell = _canonical_cell(entries[col], opts)
                 # Escape pipe characters in cells
                 cell = _escape_tabular_cell(cell)
             else:
-                cell = canon_null(opts.null_style)
+                cell = null_cell
             row_parts.append(cell)
 
         lines.append("|" + "|".join(row_parts) + "|")
@@ -502,8 +606,54 @@ def _try_tabular(items: List[GValue], opts: LooseCanonOpts) -> Optional[str]:
     return "\n".join(lines)
 
 
+def _columnar_tabular(columns: Tuple[str, ...], values: List[List[GValue]],
+                      opts: LooseCanonOpts) -> str:
+    """Emit column-wise records as tabular format.
+
+    Every row has every column, so there is no eligibility scan and no
+    missing-cell handling; cells are canonicalized one column at a time.
+    """
+    order = sorted(range(len(columns)), key=lambda i: canon_string(columns[i]))
+    lines = [_tabular_header([columns[i] for i in order], len(values[0]))]
+    cells = [
+        [_escape_tabular_cell(_canonical_cell(v, opts)) for v in values[i]]
+        for i in order
+    ]
+    for row in zip(*cells):
+        lines.append("|" + "|".join(row) + "|")
+    lines.append("@end")
+    return "\n".join(lines)
+
+
+def _canonical_cell(v: GValue, opts: LooseCanonOpts) -> str:
+    """Canonicalize one cell, encoding scalars directly.
+
+    Most cells are scalars; they skip the token buffer and join that a
+    full _canonicalize_value call sets up.
+    """
+    encode = _DISPATCH.get(v.type)
+    if encode is not None:
+        return encode(v, opts)
+    return _canonicalize_value(v, opts)
+
+
+def _tabular_header(cols: List[str], row_count: int) -> str:
+    """Header: @tab _ rows=N cols=M [col1 col2 col3]
+
+    The rows/cols metadata (v2.4.0, for streaming resync) is part of the
+    canonical form across Go and JS; Go is the source of truth, so Python
+    emits it too. parse() / parse_loose() tolerate its absence.
+    """
+    col_header = " ".join(canon_string(c) for c in cols)
+    return f"@tab _ rows={row_count} cols={len(cols)} [{col_header}]"
+
+
 def _escape_tabular_cell(s: str) -> str:
     """Escape a cell value for tabular format."""
+    # Most cells need no escaping; three substring tests are cheaper than
+    # three replace() passes.
+    if "\\" not in s and "|" not in s and "\n" not in s:
+        return s
     # Pipe and newline need escaping
     s = s.replace("\\", "\\\\")
     s = s.replace("|", "\\|")
@@ -511,29 +661,20 @@ def _escape_tabular_cell(s: str) -> str:
     return s
 
 
+_TABULAR_UNESCAPES = {'|': '|', 'n': '\n', '\\': '\\'}
+_TABULAR_ESCAPE_RE = re.compile(r'\\([|n\\])')
+
+
+def _tabular_unescape(m: "re.Match[str]") -> str:
+    return _TABULAR_UNESCAPES[m.group(1)]
+
+
 def unescape_tabular_cell(s: str) -> str:
     """Unescape a tabular cell value."""
-    result = []
-    i = 0
-    while i < len(s):
-        if s[i] == '\\' and i + 1 < len(s):
-            next_char = s[i + 1]
-            if next_char == '|':
-                result.append('|')
-                i += 2
-            elif next_char == 'n':
-                result.append('\n')
-                i += 2
-            elif next_char == '\\':
-                result.append('\\')
-                i += 2
-            else:
-                result.append(s[i])
-                i += 1
-        else:
-            result.append(s[i])
-            i += 1
-    return ''.join(result)
+    if '\\' not in s:
+        return s
+    # An unknown escape is left alone, keeping its backslash.
+    return _TABULAR_ESCAPE_RE.sub(_tabular_unescape, s)
 
 
 # ============================================================
@@ -544,46 +685,139 @@ def from_json_loose(data: Any, _depth: int = 0) -> GValue:
     """Convert a Python/JSON value to GValue."""
     if _depth > MAX_JSON_DEPTH:
         raise ValueError(f"maximum nesting depth exceeded ({MAX_JSON_DEPTH})")
-    if data is None:
-        return GValue.null()
-    elif isinstance(data, bool):
-        return GValue.bool_(data)
-    elif isinstance(data, int):
-        # JSON-domain number semantics: integers outside the IEEE-754 safe window
-        # are not representable as a JS Number, so they canonicalize as float64 —
-        # matching FromJSONLoose (Go) and fromJsonLoose (JS). This is lossy for
-        # huge ints by design; use GLYPH-Typed/int64 when full precision matters.
-        if -MAX_SAFE_INT <= data <= MAX_SAFE_INT:
-            return GValue.int_(data)
-        return GValue.float_(float(data))
-    elif isinstance(data, float):
-        if not math.isfinite(data):
-            raise ValueError("non-finite floats are not supported")
-        # In the JSON number domain there is no int/float distinction: an
-        # integer-valued float within the safe window collapses to an integer
-        # literal (1e3 -> 1000, 3.0 -> 3, -0.0 -> 0), exactly as Go/JS do.
-        if data.is_integer() and -MAX_SAFE_INT <= data <= MAX_SAFE_INT:
-            return GValue.int_(int(data))
-        return GValue.float_(data)
-    elif isinstance(data, str):
-        if len(data) > MAX_STRING_LEN:
-            raise ValueError(f"string too large ({len(data)} > {MAX_STRING_LEN})")
-        return GValue.str_(data)
-    elif isinstance(data, bytes):
-        return GValue.bytes_(data)
-    elif isinstance(data, datetime):
-        return GValue.time(data)
-    elif isinstance(data, list):
-        if len(data) > MAX_COLLECTION_LEN:
-            raise ValueError(f"list too large ({len(data)} > {MAX_COLLECTION_LEN})")
-        return GValue.list_(*[from_json_loose(item, _depth + 1) for item in data])
-    elif isinstance(data, dict):
-        if len(data) > MAX_COLLECTION_LEN:
-            raise ValueError(f"map too large ({len(data)} > {MAX_COLLECTION_LEN})")
-        entries = [MapEntry(str(k), from_json_loose(v, _depth + 1)) for k, v in data.items()]
-        return GValue.map_(*entries)
-    else:
-        return GValue.str_(str(data))
+    convert = _FROM_JSON.get(type(data))
+    if convert is not None:
+        return convert(data, _depth)
+    # Subclasses of the JSON types (IntEnum, OrderedDict, ...) take the
+    # slower isinstance route; bool must be tested before int.
+    for base, convert in _FROM_JSON_BASES:
+        if isinstance(data, base):
+            return convert(data, _depth)
+    return GValue.str_(str(data))
+
+
+def _from_json_int(data: int, _depth: int) -> GValue:
+    # JSON-domain number semantics: integers outside the IEEE-754 safe window
+    # are not representable as a JS Number, so they canonicalize as float64 —
+    # matching FromJSONLoose (Go) and fromJsonLoose (JS). This is lossy for
+    # huge ints by design; use GLYPH-Typed/int64 when full precision matters.
+    if -MAX_SAFE_INT <= data <= MAX_SAFE_INT:
+        return GValue.int_(data)
+    return GValue.float_(float(data))
+
+
+def _from_json_float(data: float, _depth: int) -> GValue:
+    if not math.isfinite(data):
+        raise ValueError("non-finite floats are not supported")
+    # In the JSON number domain there is no int/float distinction: an
+    # integer-valued float within the safe window collapses to an integer
+    # literal (1e3 -> 1000, 3.0 -> 3, -0.0 -> 0), exactly as Go/JS do.
+    if data.is_integer() and -MAX_SAFE_INT <= data <= MAX_SAFE_INT:
+        return GValue.int_(int(data))
+    return GValue.float_(data)
+
+
+def _from_json_str(data: str, _depth: int) -> GValue:
+    if len(data) > MAX_STRING_LEN:
+        raise ValueError(f"string too large ({len(data)} > {MAX_STRING_LEN})")
+    return GValue.str_(data)
+
+
+def _from_json_list(data: List[Any], _depth: int) -> GValue:
+    if len(data) > MAX_COLLECTION_LEN:
+        raise ValueError(f"list too large ({len(data)} > {MAX_COLLECTION_LEN})")
+    # Elements call their converter directly, skipping the from_json_loose
+    # frame per node; from_json_loose still handles subclasses and, past the
+    # depth limit, raises.
+    get = _FROM_JSON.get
+    columns = _record_columns(data) if _depth < MAX_JSON_DEPTH else None
+    if columns is not None:
+        # A list of objects sharing one key schema is stored column-wise
+        # so canonicalization can emit @tab without probing every row.
+        child = _depth + 2
+        if child > MAX_JSON_DEPTH:
+            get = _NO_CONVERTER.get
+        return GValue.list_of_records(columns, [
+            [(get(type(row[k])) or from_json_loose)(row[k], child) for k in columns]
+            for row in data
+        ])
+    child = _depth + 1
+    if child > MAX_JSON_DEPTH:
+        get = _NO_CONVERTER.get
+    return GValue.list_from_iter([(get(type(v)) or from_json_loose)(v, child) for v in data])
+
+
+_shared_keys: Dict[str, str] = {}
+
+
+def _shared_key(key: str) -> str:
+    """Return one shared copy of a short key, so rows repeating it share a string.
+
+    Like the parser's per-parse table, and unlike sys.intern, nothing is
+    kept for good: the table is bounded and cleared when it fills up.
+    """
+    if len(key) > _SHARED_KEY_MAX_LEN:
+        return key
+    shared = _shared_keys.get(key)
+    if shared is None:
+        if len(_shared_keys) >= _SHARED_KEYS_MAX:
+            _shared_keys.clear()
+        shared = _shared_keys.setdefault(key, key)
+    return shared
+
+
+def _from_json_dict(data: Dict[Any, Any], _depth: int) -> GValue:
+    if len(data) > MAX_COLLECTION_LEN:
+        raise ValueError(f"map too large ({len(data)} > {MAX_COLLECTION_LEN})")
+    get = _FROM_JSON.get if _depth < MAX_JSON_DEPTH else _NO_CONVERTER.get
+    child = _depth + 1
+    share = _shared_key
+    return GValue.map_from_entries([
+        MapEntry(share(str(k)), (get(type(v)) or from_json_loose)(v, child)) for k, v in data.items()
+    ])
+
+
+# Converters by base type, in isinstance precedence order.
+_FROM_JSON_BASES: Tuple[Tuple[type, Callable[[Any, int], GValue]], ...] = (
+    (bool, lambda d, _: GValue.bool_(d)),
+    (int, _from_json_int),
+    (float, _from_json_float),
+    (str, _from_json_str),
+    (bytes, lambda d, _: GValue.bytes_(d)),
+    (datetime, lambda d, _: GValue.time(d)),
+    (list, _from_json_list),
+    (dict, _from_json_dict),
+)
+
+# Exact type -> converter; one dict lookup covers the common case.
+_FROM_JSON: Dict[type, Callable[[Any, int], GValue]] = {
+    type(None): lambda d, _: GValue.null(),
+    **dict(_FROM_JSON_BASES),
+}
+
+
+# Stands in for _FROM_JSON past the depth limit, sending every element
+# through from_json_loose and its depth check.
+_NO_CONVERTER: Dict[type, Callable[[Any, int], GValue]] = {}
+
+
+def _record_columns(data: List[Any]) -> Optional[Tuple[str, ...]]:
+    """Get the shared key schema of a list of dicts, or None if there is none.
+
+    Every element must be a non-empty dict with str keys in the same order.
+    """
+    if not data or type(data[0]) is not dict:
+        return None
+    columns = tuple(data[0])
+    if not columns or len(columns) > MAX_COLLECTION_LEN:
+        return None
+    for k in columns:
+        if type(k) is not str:
+            return None
+    for row in data:
+        if type(row) is not dict or len(row) != len(columns) or tuple(row) != columns:
+            return None
+    return tuple(map(_shared_key, columns))
 
 
 def to_json_loose(v: GValue) -> Any:
@@ -644,15 +878,73 @@ def fingerprint_loose(v: GValue, opts: Optional[LooseCanonOpts] = None) -> str:
     if opts is None:
         opts = no_tabular_loose_canon_opts()  # Tabular affects fingerprint
 
-    canonical = canonicalize_loose(v, opts)
-    h = hashlib.sha256(canonical.encode('utf-8'))
+    # Hash the canonical text in chunks as it is emitted rather than
+    # materializing it; the digest is the same as hashing the full string.
+    h = hashlib.sha256()
+    update = h.update
+
+    def flush(out: List[str]) -> None:
+        update("".join(out).encode('utf-8'))
+        out.clear()
+
+    out: List[str] = []
+    _emit(v, opts, out, flush)
+    flush(out)
     return h.hexdigest()
 
 
+def fingerprint_loose_batch(values: Iterable[GValue],
+                            opts: Optional[LooseCanonOpts] = None) -> List[str]:
+    """
+    Compute fingerprint_loose for many values at once.
+    Options and lookups are resolved once for the whole batch.
+    """
+    if opts is None:
+        opts = no_tabular_loose_canon_opts()
+
+    sha256 = hashlib.sha256
+    canon = _canonicalize_value
+    return [sha256(canon(v, opts).encode('utf-8')).hexdigest() for v in values]
+
+
 def equal_loose(a: GValue, b: GValue) -> bool:
     """Check if two values are equal in loose canonical form."""
+    if a is b:
+        return True
+    ta, tb = a.type, b.type
+    if ta is not tb and not (ta in _MAP_LIKE and tb in _MAP_LIKE):
+        # Canonical forms of different types never coincide, except that a
+        # struct's form can look like a map's (e.g. an empty type name).
+        return False
+
     opts = no_tabular_loose_canon_opts()
-    return canonicalize_loose(a, opts) == canonicalize_loose(b, opts)
+    expected = _canonicalize_value(a, opts)
+    pos = 0
+
+    def flush(out: List[str]) -> None:
+        # Compare b's output against a's chunk by chunk and stop at the
+        # first difference instead of building b's full string.
+        nonlocal pos
+        chunk = "".join(out)
+        out.clear()
+        if not expected.startswith(chunk, pos):
+            raise _Mismatch
+        pos += len(chunk)
+
+    out: List[str] = []
+    try:
+        _emit(b, opts, out, flush)
+        flush(out)
+    except _Mismatch:
+        return False
+    return pos == len(expected)
+
+
+class _Mismatch(Exception):
+    """Raised inside equal_loose to stop emitting at the first difference."""
+
+
+_MAP_LIKE = (GType.MAP, GType.STRUCT)
 
 
 # ============================================================
@@ -661,8 +953,23 @@ def equal_loose(a: GValue, b: GValue) -> bool:
 
 def parse_json_loose(json_str: str) -> GValue:
     """Parse JSON string to GValue."""
+    return from_json_loose(_json_loads(json_str))
+
+
+def _json_loads(json_str: str) -> Any:
+    """json.loads, decoded by orjson when it is installed.
+
+    orjson is stricter than the standard library (no integers beyond 64
+    bits, no NaN/Infinity, no lone surrogates), so anything it rejects is
+    handed to json.loads, which either accepts it or raises as before.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(json_str)
+        except _orjson.JSONDecodeError:
+            pass
     import json
-    return from_json_loose(json.loads(json_str))
+    return json.loads(json_str)
 
 
 def stringify_json_loose(v: GValue, indent: Optional[int] = None) -> str:
@@ -7,11 +7,13 @@ Parses GLYPH-Loose text format into GValue objects.
 from __future__ import annotations
 import base64
 import math
-from contextlib import contextmanager
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional
 
-from .types import GValue, MapEntry
+from .types import GType, GValue, MapEntry
+from .loose import unescape_tabular_cell
 
 
 # ============================================================
@@ -19,32 +21,58 @@ from .types import GValue, MapEntry
 # ============================================================
 
 class TokenType:
-    EOF = "EOF"
-    LBRACE = "{"
-    RBRACE = "}"
-    LBRACKET = "["
-    RBRACKET = "]"
-    LPAREN = "("
-    RPAREN = ")"
-    EQUALS = "="
-    COLON = ":"
-    COMMA = ","
-    PIPE = "|"
-    CARET = "^"
-    AT = "@"
-    NULL = "NULL"
-    BOOL = "BOOL"
-    INT = "INT"
-    FLOAT = "FLOAT"
-    STRING = "STRING"
-    BYTES = "BYTES"
-    IDENT = "IDENT"
-    NEWLINE = "NEWLINE"
+    EOF = 0
+    LBRACE = 1
+    RBRACE = 2
+    LBRACKET = 3
+    RBRACKET = 4
+    LPAREN = 5
+    RPAREN = 6
+    EQUALS = 7
+    COLON = 8
+    COMMA = 9
+    PIPE = 10
+    CARET = 11
+    AT = 12
+    NULL = 13
+    BOOL = 14
+    INT = 15
+    FLOAT = 16
+    STRING = 17
+    BYTES = 18
+    IDENT = 19
+    NEWLINE = 20
+
+
+# Token type -> display name used in error messages.
+_TOKEN_NAMES = {
+    TokenType.EOF: "EOF",
+    TokenType.LBRACE: "{",
+    TokenType.RBRACE: "}",
+    TokenType.LBRACKET: "[",
+    TokenType.RBRACKET: "]",
+    TokenType.LPAREN: "(",
+    TokenType.RPAREN: ")",
+    TokenType.EQUALS: "=",
+    TokenType.COLON: ":",
+    TokenType.COMMA: ",",
+    TokenType.PIPE: "|",
+    TokenType.CARET: "^",
+    TokenType.AT: "@",
+    TokenType.NULL: "NULL",
+    TokenType.BOOL: "BOOL",
+    TokenType.INT: "INT",
+    TokenType.FLOAT: "FLOAT",
+    TokenType.STRING: "STRING",
+    TokenType.BYTES: "BYTES",
+    TokenType.IDENT: "IDENT",
+    TokenType.NEWLINE: "NEWLINE",
+}
 
 
 @dataclass
 class Token:
-    type: str
+    type: int
     value: Any
     pos: int
 
@@ -53,6 +81,17 @@ DEFAULT_MAX_DEPTH = 128  # aligned with Go, JS, C, Rust
 MAX_COLLECTION_LEN = 1_000_000  # 1M elements
 MAX_STRING_LEN = 10 * 1024 * 1024  # 10MB
 
+# Parsed tabular cells, reused across rows. Only scalars with immutable
+# payloads are cached; containers and IDs (whose RefID can be edited in
+# place) are parsed fresh.
+_CELL_CACHE: OrderedDict[str, GValue] = OrderedDict()
+_CELL_CACHE_MAX = 4096
+_CELL_CACHE_MAX_LEN = 64
+_NULL_CELLS = frozenset({"", "∅", "_"})
+_CACHEABLE_CELL_TYPES = frozenset({
+    GType.NULL, GType.BOOL, GType.INT, GType.FLOAT, GType.STR, GType.BYTES,
+})
+
 
 class Lexer:
     """Tokenizer for GLYPH text."""
@@ -62,6 +101,12 @@ class Lexer:
         self.pos = 0
         self.length = len(text)
 
+    def reset(self, text: str) -> None:
+        """Start over on new input, keeping this lexer object."""
+        self.text = text
+        self.pos = 0
+        self.length = len(text)
+
     def peek_char(self) -> str:
         if self.pos >= self.length:
             return ""
@@ -83,139 +128,116 @@ class Lexer:
             self.pos += 1
 
     def next_token(self) -> Token:
-        self.skip_whitespace()
-
-        if self.pos >= self.length:
-            return Token(TokenType.EOF, None, self.pos)
-
+        # Whitespace skipping is inlined; this runs once per token.
+        text = self.text
+        length = self.length
         start = self.pos
-        c = self.peek_char()
+        while start < length and text[start] in " \t\r":
+            start += 1
+        self.pos = start
 
-        # Single character tokens
-        if c == "{":
-            self.pos += 1
-            return Token(TokenType.LBRACE, c, start)
-        if c == "}":
-            self.pos += 1
-            return Token(TokenType.RBRACE, c, start)
-        if c == "[":
-            self.pos += 1
-            return Token(TokenType.LBRACKET, c, start)
-        if c == "]":
-            self.pos += 1
-            return Token(TokenType.RBRACKET, c, start)
-        if c == "(":
-            self.pos += 1
-            return Token(TokenType.LPAREN, c, start)
-        if c == ")":
-            self.pos += 1
-            return Token(TokenType.RPAREN, c, start)
-        if c == "=":
-            self.pos += 1
-            return Token(TokenType.EQUALS, c, start)
-        if c == ":":
-            self.pos += 1
-            return Token(TokenType.COLON, c, start)
-        if c == ",":
-            self.pos += 1
-            return Token(TokenType.COMMA, c, start)
-        if c == "|":
-            self.pos += 1
-            return Token(TokenType.PIPE, c, start)
-        if c == "^":
-            self.pos += 1
-            return Token(TokenType.CARET, c, start)
-        if c == "@":
-            self.pos += 1
-            return Token(TokenType.AT, c, start)
-        if c == "\n":
-            self.pos += 1
-            return Token(TokenType.NEWLINE, c, start)
-
-        # Null symbol
-        if c == "∅" or c == "_":
-            self.pos += 1
-            return Token(TokenType.NULL, None, start)
+        if start >= length:
+            return Token(TokenType.EOF, None, start)
 
-        # Quoted string
-        if c == '"':
-            return self._read_string()
+        c = text[start]
 
-        # Bytes literal
-        if c == "b" and self.pos + 1 < self.length:
-            if self.text[self.pos:self.pos + 4] == 'b64"':
-                return self._read_bytes()
-
-        # Number or identifier
-        if c == "-" or c.isdigit():
+        # Single character tokens
+        ttype = _SINGLE_CHAR_TOKENS.get(c)
+        if ttype is not None:
+            self.pos = start + 1
+            return Token(ttype, None if ttype == TokenType.NULL else c, start)
+
+        # Strings, bytes, numbers and identifiers, by their first character
+        handler = _TOKEN_READERS.get(c)
+        if handler is not None:
+            return handler(self)
+
+        # Non-ASCII digits and letters
+        if c.isdigit():
             return self._read_number_or_ident()
-
-        # Identifier or keyword
-        if c.isalpha() or c == "_":
+        if c.isalpha():
             return self._read_ident()
 
         raise ValueError(f"unexpected character '{c}' at position {self.pos}")
 
     def _read_string(self) -> Token:
         start = self.pos
-        self.pos += 1  # Skip opening quote
-        result = []
+        text = self.text
+        pos = self.pos + 1  # Skip opening quote
+        quote = text.find('"', pos)
 
-        while self.pos < self.length:
-            c = self.text[self.pos]
-            if c == '"':
-                self.pos += 1
+        # Most strings have no escapes: take the body as one slice.
+        if 0 <= quote - pos <= MAX_STRING_LEN and text.find('\\', pos, quote) < 0:
+            self.pos = quote + 1
+            return Token(TokenType.STRING, text[pos:quote], start)
+
+        result = []
+        size = 0
+
+        # Copy each run of plain characters as one slice; only escapes are
+        # handled one at a time.
+        while True:
+            if 0 <= quote < pos:
+                quote = text.find('"', pos)  # the previous quote was escaped
+            stop = quote if quote >= 0 else self.length
+            bs = text.find('\\', pos, stop)
+            end = bs if bs >= 0 else stop
+            if size + end - pos > MAX_STRING_LEN:
+                raise ValueError(f"string too large (>{MAX_STRING_LEN} characters)")
+            if end > pos:
+                result.append(text[pos:end])
+                size += end - pos
+            if bs < 0:
+                if quote < 0:
+                    self.pos = self.length
+                    raise ValueError("unterminated string")
+                self.pos = quote + 1
                 return Token(TokenType.STRING, "".join(result), start)
-            if len(result) >= MAX_STRING_LEN:
+
+            if size >= MAX_STRING_LEN:
                 raise ValueError(f"string too large (>{MAX_STRING_LEN} characters)")
-            if c == '\\':
-                self.pos += 1
-                if self.pos >= self.length:
-                    raise ValueError("unterminated escape sequence")
-                esc = self.text[self.pos]
-                if esc == 'n':
-                    result.append('\n')
-                elif esc == 'r':
-                    result.append('\r')
-                elif esc == 't':
-                    result.append('\t')
-                elif esc == '"':
-                    result.append('"')
-                elif esc == '\\':
-                    result.append('\\')
-                elif esc == 'u':
-                    if self.pos + 5 > self.length:
-                        raise ValueError("invalid unicode escape")
-                    hex_str = self.text[self.pos + 1:self.pos + 5]
-                    result.append(chr(int(hex_str, 16)))
-                    self.pos += 4
-                else:
-                    result.append(esc)
+            pos = bs + 1
+            if pos >= self.length:
+                self.pos = pos
+                raise ValueError("unterminated escape sequence")
+            esc = text[pos]
+            if esc == 'n':
+                result.append('\n')
+            elif esc == 'r':
+                result.append('\r')
+            elif esc == 't':
+                result.append('\t')
+            elif esc == 'u':
+                if pos + 5 > self.length:
+                    raise ValueError("invalid unicode escape")
+                hex_str = text[pos + 1:pos + 5]
+                result.append(chr(int(hex_str, 16)))
+                pos += 4
             else:
-                result.append(c)
-            self.pos += 1
-
-        raise ValueError("unterminated string")
+                # \" and \\ are the character itself, as is any unknown escape.
+                result.append(esc)
+            size += 1
+            pos += 1
 
     def _read_bytes(self) -> Token:
         start = self.pos
-        self.pos += 4  # Skip b64"
-        result = []
-
-        while self.pos < self.length:
-            c = self.text[self.pos]
-            if c == '"':
-                self.pos += 1
-                b64_str = "".join(result)
-                try:
-                    data = base64.b64decode(b64_str, validate=True)
-                except Exception as e:
-                    raise ValueError(f"invalid base64: {e}")
-                return Token(TokenType.BYTES, data, start)
-            result.append(c)
-            self.pos += 1
+        body = self.pos + 4  # Skip b64"
+        end = self.text.find('"', body)
+        if end < 0:
+            self.pos = self.length
+            raise ValueError("unterminated bytes literal")
+        self.pos = end + 1
+        b64_str = self.text[body:end]
+        try:
+            data = base64.b64decode(b64_str, validate=True)
+        except Exception as e:
+            raise ValueError(f"invalid base64: {e}")
+        return Token(TokenType.BYTES, data, start)
 
-        raise ValueError("unterminated bytes literal")
+    def _read_bytes_or_ident(self) -> Token:
+        if self.text.startswith('b64"', self.pos):
+            return self._read_bytes()
+        return self._read_ident()
 
     def _parse_float_token(self, literal: str, start: int) -> Token:
         try:
@@ -231,42 +253,44 @@ class Lexer:
         return Token(TokenType.FLOAT, value, start)
 
     def _read_number_or_ident(self) -> Token:
-        start = self.pos
-        result = []
+        text = self.text
+        length = self.length
+        start = pos = self.pos
 
         # Could be negative number or identifier starting with -
-        if self.peek_char() == '-':
-            result.append(self.next_char())
+        if text[pos] == '-':
+            pos += 1
             # Check for -Inf (with word boundary: next char must not be alphanumeric/underscore)
-            if (self.pos + 2 < self.length and self.text[self.pos:self.pos+3] == "Inf"
-                    and (self.pos + 3 >= self.length or (not self.text[self.pos+3].isalnum() and self.text[self.pos+3] != '_'))):
+            if (pos + 2 < length and text[pos:pos+3] == "Inf"
+                    and (pos + 3 >= length or (not text[pos+3].isalnum() and text[pos+3] != '_'))):
+                self.pos = pos
                 raise ValueError(f"non-finite float literal '-Inf' at position {start}")
 
         # Read digits and decimal point
         has_dot = False
         has_exp = False
 
-        while self.pos < self.length:
-            c = self.peek_char()
+        while pos < length:
+            c = text[pos]
             if c.isdigit():
-                result.append(self.next_char())
+                pos += 1
             elif c == '.' and not has_dot and not has_exp:
                 has_dot = True
-                result.append(self.next_char())
+                pos += 1
             elif c in 'eE' and not has_exp:
                 has_exp = True
-                result.append(self.next_char())
-                if self.peek_char() in '+-':
-                    result.append(self.next_char())
+                pos += 1
+                if pos < length and text[pos] in '+-':
+                    pos += 1
             elif c.isalpha() or c == '_':
                 # It's an identifier
-                while self.pos < self.length and (self.peek_char().isalnum() or self.peek_char() in '_-./@+'):
-                    result.append(self.next_char())
-                return Token(TokenType.IDENT, "".join(result), start)
+                pos = self.pos = _IDENT_CHARS_RE.match(text, pos).end()  # type: ignore
+                return Token(TokenType.IDENT, text[start:pos], start)
             else:
                 break
 
-        s = "".join(result)
+        self.pos = pos
+        s = text[start:pos]
 
         # Determine if it's int or float
         if has_dot or has_exp:
@@ -278,33 +302,68 @@ class Lexer:
                 return Token(TokenType.IDENT, s, start)
 
     def _read_ident(self) -> Token:
+        text = self.text
         start = self.pos
-        result = []
-
-        while self.pos < self.length:
-            c = self.peek_char()
-            if c.isalnum() or c in '_-./@+':
-                result.append(self.next_char())
-            else:
-                break
-
-        s = "".join(result)
+        pos = self.pos = _IDENT_CHARS_RE.match(text, start).end()  # type: ignore
+        s = text[start:pos]
 
         # Check for keywords
-        if s == "t" or s == "true":
-            return Token(TokenType.BOOL, True, start)
-        if s == "f" or s == "false":
-            return Token(TokenType.BOOL, False, start)
-        if s == "null" or s == "nil":
-            return Token(TokenType.NULL, None, start)
-        if s == "NaN":
-            raise ValueError(f"non-finite float literal 'NaN' at position {start}")
-        if s == "Inf":
-            raise ValueError(f"non-finite float literal 'Inf' at position {start}")
+        keyword = _KEYWORDS.get(s)
+        if keyword is not None:
+            return Token(keyword[0], keyword[1], start)
+        if s in _NON_FINITE_WORDS:
+            raise ValueError(f"non-finite float literal '{s}' at position {start}")
 
         return Token(TokenType.IDENT, s, start)
 
 
+# A run of identifier characters: c.isalnum() or c in '_-./@+'. In str
+# patterns \w is exactly isalnum() plus '_', so the scan runs in C. It can
+# match empty, so match() never returns None.
+_IDENT_CHARS_RE = re.compile(r'[\w\-./@+]*')
+
+# Identifiers that are literals: word -> (token type, value).
+_KEYWORDS = {
+    "t": (TokenType.BOOL, True),
+    "true": (TokenType.BOOL, True),
+    "f": (TokenType.BOOL, False),
+    "false": (TokenType.BOOL, False),
+    "null": (TokenType.NULL, None),
+    "nil": (TokenType.NULL, None),
+}
+
+# Identifiers rejected as non-finite float literals.
+_NON_FINITE_WORDS = frozenset({"NaN", "Inf"})
+
+# Characters that are a whole token by themselves.
+_SINGLE_CHAR_TOKENS = {
+    "{": TokenType.LBRACE,
+    "}": TokenType.RBRACE,
+    "[": TokenType.LBRACKET,
+    "]": TokenType.RBRACKET,
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    "=": TokenType.EQUALS,
+    ":": TokenType.COLON,
+    ",": TokenType.COMMA,
+    "|": TokenType.PIPE,
+    "^": TokenType.CARET,
+    "@": TokenType.AT,
+    "\n": TokenType.NEWLINE,
+    "∅": TokenType.NULL,
+    "_": TokenType.NULL,
+}
+
+# First character -> reader for multi-character tokens.
+_TOKEN_READERS = {
+    '"': Lexer._read_string,
+    "-": Lexer._read_number_or_ident,
+    **dict.fromkeys("0123456789", Lexer._read_number_or_ident),
+    **dict.fromkeys("ABCDEFGHIJKLMNOPQRSTUVWXYZacdefghijklmnopqrstuvwxyz", Lexer._read_ident),
+    "b": Lexer._read_bytes_or_ident,
+}
+
+
 # ============================================================
 # Parser
 # ============================================================
@@ -314,37 +373,36 @@ class Parser:
 
     def __init__(self, text: str, max_depth: int = DEFAULT_MAX_DEPTH, nesting_depth: int = 0):
         self.lexer = Lexer(text)
-        self.peeked: Optional[Token] = None
+        # No lookahead buffer: peek() re-lexes, so advance() is a plain call.
+        self.next_token = self.lexer.next_token
         self.max_depth = max_depth
         self.depth = nesting_depth
+        # Keys and column names seen in this document, so that repeats share
+        # one string. Per parse, unlike sys.intern, so nothing outlives it.
+        self.shared_keys: Dict[str, str] = {}
         # Don't read initial token here - let parse() do it
 
-    @contextmanager
-    def _container(self, kind: str):
+    def _enter(self, kind: str) -> None:
+        """Count one more level of nesting; the caller decrements in a finally."""
         if self.depth >= self.max_depth:
             raise ValueError(f"maximum nesting depth exceeded while parsing {kind}")
         self.depth += 1
-        try:
-            yield
-        finally:
-            self.depth -= 1
 
     def peek(self) -> Token:
-        if self.peeked is None:
-            self.peeked = self.lexer.next_token()
-        return self.peeked
+        """Return the token after the current one without consuming it."""
+        pos = self.lexer.pos
+        try:
+            return self.lexer.next_token()
+        finally:
+            self.lexer.pos = pos
 
     def advance(self) -> Token:
-        if self.peeked is not None:
-            self.current = self.peeked
-            self.peeked = None
-        else:
-            self.current = self.lexer.next_token()
+        self.current = self.next_token()
         return self.current
 
-    def expect(self, token_type: str) -> Token:
+    def expect(self, token_type: int) -> Token:
         if self.current.type != token_type:
-            raise ValueError(f"expected {token_type}, got {self.current.type}")
+            raise ValueError(f"expected {_TOKEN_NAMES[token_type]}, got {_TOKEN_NAMES[self.current.type]}")
         tok = self.current
         self.advance()
         return tok
@@ -364,47 +422,18 @@ class Parser:
         """Parse a single value."""
         tok = self.current
 
-        if tok.type == TokenType.NULL:
+        ctor = _SCALAR_VALUES.get(tok.type)
+        if ctor is not None:
             self.advance()
-            return GValue.null()
+            return ctor(tok.value)
 
-        if tok.type == TokenType.BOOL:
-            self.advance()
-            return GValue.bool_(tok.value)
+        # ^ref, [list], {map}, @directive, or an identifier that may start a
+        # struct or sum
+        parse_compound = _COMPOUND_VALUES.get(tok.type)
+        if parse_compound is not None:
+            return parse_compound(self)
 
-        if tok.type == TokenType.INT:
-            self.advance()
-            return GValue.int_(tok.value)
-
-        if tok.type == TokenType.FLOAT:
-            self.advance()
-            return GValue.float_(tok.value)
-
-        if tok.type == TokenType.STRING:
-            self.advance()
-            return GValue.str_(tok.value)
-
-        if tok.type == TokenType.BYTES:
-            self.advance()
-            return GValue.bytes_(tok.value)
-
-        if tok.type == TokenType.CARET:
-            return self._parse_ref()
-
-        if tok.type == TokenType.LBRACKET:
-            return self._parse_list()
-
-        if tok.type == TokenType.LBRACE:
-            return self._parse_map()
-
-        if tok.type == TokenType.AT:
-            return self._parse_directive()
-
-        if tok.type == TokenType.IDENT:
-            # Could be: bare string, struct, or sum
-            return self._parse_ident_value()
-
-        raise ValueError(f"unexpected token {tok.type} at position {tok.pos}")
+        raise ValueError(f"unexpected token {_TOKEN_NAMES[tok.type]} at position {tok.pos}")
 
     def _parse_ref(self) -> GValue:
         """Parse a reference (^prefix:value or ^value)."""
@@ -431,7 +460,7 @@ class Parser:
             first = str(self.current.value)
             self.advance()
         else:
-            raise ValueError(f"expected reference value, got {self.current.type}")
+            raise ValueError(f"expected reference value, got {_TOKEN_NAMES[self.current.type]}")
 
         if self.current.type == TokenType.COLON:
             self.advance()
@@ -449,72 +478,92 @@ class Parser:
                 second = "t" if self.current.value else "f"
                 self.advance()
             else:
-                raise ValueError(f"expected reference value part, got {self.current.type}")
+                raise ValueError(f"expected reference value part, got {_TOKEN_NAMES[self.current.type]}")
             return GValue.id(first, second)
 
         return GValue.id("", first)
 
     def _parse_list(self) -> GValue:
         """Parse a list [...] """
-        with self._container("list"):
+        self._enter("list")
+        try:
             self.expect(TokenType.LBRACKET)
+            next_token = self.next_token
+            parse_value = self._parse_value
             items = []
 
-            while self.current.type != TokenType.RBRACKET:
-                if self.current.type == TokenType.EOF:
+            tok = self.current
+            while True:
+                tt = tok.type
+                if tt == TokenType.RBRACKET:
+                    break
+                if tt == TokenType.EOF:
                     raise ValueError("unterminated list")
-                if self.current.type == TokenType.COMMA:
-                    self.advance()
-                    continue
-                if self.current.type == TokenType.NEWLINE:
-                    self.advance()
+                if tt == TokenType.COMMA or tt == TokenType.NEWLINE:
+                    tok = self.current = next_token()
                     continue
 
                 if len(items) >= MAX_COLLECTION_LEN:
                     raise ValueError(f"list too large (>{MAX_COLLECTION_LEN} elements)")
-                items.append(self._parse_value())
+                items.append(parse_value())
+                tok = self.current
 
-            self.expect(TokenType.RBRACKET)
-            return GValue.list_(*items)
+            self.current = next_token()
+            return GValue.list_from_iter(items)
+        finally:
+            self.depth -= 1
 
     def _parse_map(self) -> GValue:
         """Parse a map {...}"""
-        with self._container("map"):
+        self._enter("map")
+        try:
             self.expect(TokenType.LBRACE)
-            entries = []
+            entries = self._parse_entries("map", "entries", "key", "key")
+            return GValue.map_from_entries(entries)
+        finally:
+            self.depth -= 1
 
-            while self.current.type != TokenType.RBRACE:
-                if self.current.type == TokenType.EOF:
-                    raise ValueError("unterminated map")
-                if self.current.type == TokenType.COMMA:
-                    self.advance()
-                    continue
-                if self.current.type == TokenType.NEWLINE:
-                    self.advance()
-                    continue
+    def _parse_entries(self, kind: str, unit: str, key_name: str, key_label: str) -> List[MapEntry]:
+        """Parse key=value entries of a map or struct through the closing brace.
 
-                if len(entries) >= MAX_COLLECTION_LEN:
-                    raise ValueError(f"map too large (>{MAX_COLLECTION_LEN} entries)")
+        The current token is the first one after the opening brace. kind,
+        unit, key_name and key_label only word the error messages.
+        """
+        next_token = self.next_token
+        parse_value = self._parse_value
+        share = self.shared_keys.setdefault
+        entries = []
 
-                # Parse key
-                if self.current.type == TokenType.IDENT:
-                    key = self.current.value
-                    self.advance()
-                elif self.current.type == TokenType.STRING:
-                    key = self.current.value
-                    self.advance()
-                else:
-                    raise ValueError(f"expected key, got {self.current.type}")
+        tok = self.current
+        while True:
+            tt = tok.type
+            if tt == TokenType.RBRACE:
+                break
+            if tt == TokenType.EOF:
+                raise ValueError(f"unterminated {kind}")
+            if tt == TokenType.COMMA or tt == TokenType.NEWLINE:
+                tok = self.current = next_token()
+                continue
 
-                if self.current.type not in (TokenType.EQUALS, TokenType.COLON):
-                    raise ValueError(f"expected '=' or ':' after key {key!r}")
-                self.advance()
+            if len(entries) >= MAX_COLLECTION_LEN:
+                raise ValueError(f"{kind} too large (>{MAX_COLLECTION_LEN} {unit})")
 
-                value = self._parse_value()
-                entries.append(MapEntry(key, value))
+            if tt != TokenType.IDENT and tt != TokenType.STRING:
+                raise ValueError(f"expected {key_name}, got {_TOKEN_NAMES[tt]}")
+            # Keys repeat across a document; sharing one string per distinct
+            # key lets key comparisons hit the identity check.
+            key = share(tok.value, tok.value)
+
+            tok = self.current = next_token()
+            if tok.type != TokenType.EQUALS and tok.type != TokenType.COLON:
+                raise ValueError(f"expected '=' or ':' after {key_label} {key!r}")
+            self.current = next_token()
+
+            entries.append(MapEntry(key, parse_value()))
+            tok = self.current
 
-            self.expect(TokenType.RBRACE)
-            return GValue.map_(*entries)
+        self.current = next_token()
+        return entries
 
     def _parse_ident_value(self) -> GValue:
         """Parse an identifier which could be a bare string, struct, or sum."""
@@ -523,46 +572,20 @@ class Parser:
 
         if self.current.type == TokenType.LBRACE:
             # Struct: Name{...}
-            with self._container("struct"):
+            self._enter("struct")
+            try:
                 self.advance()
-                fields = []
-
-                while self.current.type != TokenType.RBRACE:
-                    if self.current.type == TokenType.EOF:
-                        raise ValueError("unterminated struct")
-                    if self.current.type == TokenType.COMMA:
-                        self.advance()
-                        continue
-                    if self.current.type == TokenType.NEWLINE:
-                        self.advance()
-                        continue
-
-                    if len(fields) >= MAX_COLLECTION_LEN:
-                        raise ValueError(f"struct too large (>{MAX_COLLECTION_LEN} fields)")
-
-                    # Parse field
-                    if self.current.type == TokenType.IDENT:
-                        key = self.current.value
-                        self.advance()
-                    elif self.current.type == TokenType.STRING:
-                        key = self.current.value
-                        self.advance()
-                    else:
-                        raise ValueError(f"expected field name, got {self.current.type}")
-
-                    if self.current.type not in (TokenType.EQUALS, TokenType.COLON):
-                        raise ValueError(f"expected '=' or ':' after field {key!r}")
-                    self.advance()
-
-                    value = self._parse_value()
-                    fields.append(MapEntry(key, value))
-
-                self.expect(TokenType.RBRACE)
-                return GValue.struct(name, *fields)
+                fields = self._parse_entries("struct", "fields", "field name", "field")
+                gv = GValue.struct(name)
+                gv.as_struct().fields = fields
+                return gv
+            finally:
+                self.depth -= 1
 
         if self.current.type == TokenType.LPAREN:
             # Sum: Tag(value) or Tag()
-            with self._container("sum"):
+            self._enter("sum")
+            try:
                 self.advance()
 
                 if self.current.type == TokenType.RPAREN:
@@ -572,6 +595,8 @@ class Parser:
                 value = self._parse_value()
                 self.expect(TokenType.RPAREN)
                 return GValue.sum(name, value)
+            finally:
+                self.depth -= 1
 
         # Bare string
         return GValue.str_(name)
@@ -581,7 +606,7 @@ class Parser:
         self.expect(TokenType.AT)
 
         if self.current.type != TokenType.IDENT:
-            raise ValueError(f"expected directive name, got {self.current.type}")
+            raise ValueError(f"expected directive name, got {_TOKEN_NAMES[self.current.type]}")
 
         directive = self.current.value
         self.advance()
@@ -593,7 +618,8 @@ class Parser:
 
     def _parse_tabular(self) -> GValue:
         """Parse tabular format: @tab _ [cols] |row|... @end"""
-        with self._container("tabular directive"):
+        self._enter("tabular directive")
+        try:
             # Skip the _ placeholder
             if self.current.type == TokenType.IDENT and self.current.value == "_":
                 self.advance()
@@ -611,23 +637,25 @@ class Parser:
 
             self.advance()
             cols = []
+            share = self.shared_keys.setdefault
             while self.current.type != TokenType.RBRACKET:
                 if self.current.type == TokenType.IDENT:
-                    cols.append(self.current.value)
+                    cols.append(share(self.current.value, self.current.value))
                     self.advance()
                 elif self.current.type == TokenType.STRING:
-                    cols.append(self.current.value)
+                    cols.append(share(self.current.value, self.current.value))
                     self.advance()
                 elif self.current.type == TokenType.COMMA:
                     self.advance()
                 elif self.current.type == TokenType.NEWLINE:
                     self.advance()
                 else:
-                    raise ValueError(f"expected column name, got {self.current.type}")
+                    raise ValueError(f"expected column name, got {_TOKEN_NAMES[self.current.type]}")
 
             self.expect(TokenType.RBRACKET)
 
             # Parse rows
+            read_row = self._row_reader(cols)
             rows = []
             while True:
                 # Skip newlines
@@ -642,74 +670,123 @@ class Parser:
                     raise ValueError("expected @end")
 
                 if self.current.type == TokenType.PIPE:
-                    row = self._parse_tabular_row(cols)
-                    rows.append(row)
+                    rows.append(read_row())
+                    # Next token after the row (should be NEWLINE or @)
+                    self.advance()
                 elif self.current.type == TokenType.EOF:
                     break
                 else:
-                    raise ValueError(f"expected row or @end, got {self.current.type}")
-
-            return GValue.list_(*rows)
+                    raise ValueError(f"expected row or @end, got {_TOKEN_NAMES[self.current.type]}")
 
-    def _parse_tabular_row(self, cols: List[str]) -> GValue:
-        """Parse a single tabular row: |val|val|val|"""
-        # The current token is PIPE. The lexer.pos is right after the pipe character.
-        # We need to read raw characters for each cell, not tokenize them.
-        if self.current.type != TokenType.PIPE:
-            raise ValueError(f"expected |, got {self.current.type}")
-
-        # lexer.pos is right after the opening pipe - that's where cell content starts
-        entries = []
+            return GValue.list_from_iter(rows)
+        finally:
+            self.depth -= 1
 
-        for i, col in enumerate(cols):
-            # Read until next pipe (handling escapes)
-            cell_chars = []
+    def _row_reader(self, cols: List[str]) -> Callable[[], GValue]:
+        """Build the row parser for one table: |val|val|val| -> map.
+
+        Everything that is the same for every row (columns, source text,
+        cache and parser settings) is bound once here, so each call only
+        scans and parses its cells.
+        """
+        lexer = self.lexer
+        text = lexer.text
+        find = text.find
+        keys = tuple(cols)
+        cache_get = _CELL_CACHE.get
+        max_depth = self.max_depth
+        depth = self.depth
+        null = GValue.null()
+        # One parser serves every cell of the table; a nested table inside a
+        # cell gets its own row reader, so the reuse never overlaps.
+        cell_parser = Parser("", max_depth=max_depth, nesting_depth=depth)
+        cell_parser.shared_keys = self.shared_keys
+        reset_cell = cell_parser.lexer.reset
+
+        def read_row() -> GValue:
+            # The current token is the opening PIPE and lexer.pos is right
+            # after it. Cells are read as raw text, not tokenized.
+            values = []
+            pos = lexer.pos
+            for _ in keys:
+                # The cell runs to the next pipe; only when the cell holds a
+                # backslash can that pipe be escaped.
+                end = find('|', pos)
+                if end >= 0 and find('\\', pos, end) >= 0:
+                    end = _unescaped_pipe(text, pos, end)
+                if end < 0:
+                    lexer.pos = lexer.length
+                    raise ValueError("expected | after cell")
+
+                cell_text = text[pos:end]
+                pos = end + 1  # Skip the closing pipe
+                if '\\' in cell_text:
+                    cell_text = unescape_tabular_cell(cell_text)
+                cell_text = cell_text.strip()
+
+                value = cache_get(cell_text)
+                if value is None:
+                    if cell_text in _NULL_CELLS:
+                        value = null
+                    else:
+                        reset_cell(cell_text)
+                        cell_parser.depth = depth
+                        value = cell_parser.parse()
+                        _cache_cell(cell_text, value)
+                values.append(value)
 
-            while self.lexer.pos < self.lexer.length:
-                c = self.lexer.text[self.lexer.pos]
-                if c == '|':
-                    break
-                if c == '\\' and self.lexer.pos + 1 < self.lexer.length:
-                    next_c = self.lexer.text[self.lexer.pos + 1]
-                    if next_c == '|':
-                        cell_chars.append('|')
-                        self.lexer.pos += 2
-                        continue
-                    elif next_c == 'n':
-                        cell_chars.append('\n')
-                        self.lexer.pos += 2
-                        continue
-                    elif next_c == '\\':
-                        cell_chars.append('\\')
-                        self.lexer.pos += 2
-                        continue
-                cell_chars.append(c)
-                self.lexer.pos += 1
-
-            # Must have a pipe after cell
-            if self.lexer.pos >= self.lexer.length or self.lexer.text[self.lexer.pos] != '|':
-                raise ValueError("expected | after cell")
-            self.lexer.pos += 1  # Skip the closing pipe
-
-            cell_text = "".join(cell_chars).strip()
-
-            # Parse cell value
-            if cell_text == "" or cell_text == "∅" or cell_text == "_":
-                value = GValue.null()
-            else:
-                cell_parser = Parser(
-                    cell_text,
-                    max_depth=self.max_depth,
-                    nesting_depth=self.depth,
-                )
-                value = cell_parser.parse()
+            lexer.pos = pos
+            return GValue.map_from_entries(map(MapEntry, keys, values))
 
-            entries.append(MapEntry(col, value))
+        return read_row
 
-        # Now get the next token (should be NEWLINE or @)
-        self.current = self.lexer.next_token()
 
-        return GValue.map_(*entries)
+def _cache_cell(cell_text: str, value: GValue) -> None:
+    """Remember a parsed scalar cell, evicting the oldest entry when full."""
+    if len(cell_text) > _CELL_CACHE_MAX_LEN or value.type not in _CACHEABLE_CELL_TYPES:
+        return
+    if len(_CELL_CACHE) >= _CELL_CACHE_MAX:
+        try:
+            _CELL_CACHE.popitem(last=False)
+        except KeyError:
+            pass
+    _CELL_CACHE[cell_text] = value
+
+
+def _unescaped_pipe(text: str, pos: int, end: int) -> int:
+    """Return the first pipe at or after end not escaped by a backslash, or -1.
+
+    Backslashes pair up as \\\\ escapes, so a pipe is escaped exactly when an odd
+    run of backslashes (counted back to pos) precedes it.
+    """
+    while end >= 0:
+        run = end
+        while run > pos and text[run - 1] == '\\':
+            run -= 1
+        if (end - run) % 2 == 0:
+            return end
+        end = text.find('|', end + 1)
+    return end
+
+
+# Token type -> GValue constructor for tokens that are a whole value.
+_SCALAR_VALUES: Dict[int, Callable[[Any], GValue]] = {
+    TokenType.NULL: lambda _: GValue.null(),
+    TokenType.BOOL: GValue.bool_,
+    TokenType.INT: GValue.int_,
+    TokenType.FLOAT: GValue.float_,
+    TokenType.STRING: GValue.str_,
+    TokenType.BYTES: GValue.bytes_,
+}
+
+# Token type -> Parser method for values spanning several tokens.
+_COMPOUND_VALUES = {
+    TokenType.CARET: Parser._parse_ref,
+    TokenType.LBRACKET: Parser._parse_list,
+    TokenType.LBRACE: Parser._parse_map,
+    TokenType.AT: Parser._parse_directive,
+    TokenType.IDENT: Parser._parse_ident_value,
+}
 
 
 # ============================================================
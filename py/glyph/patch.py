@@ -19,7 +19,6 @@ Operations:
 
 from __future__ import annotations
 
-import copy
 import hashlib
 from dataclasses import dataclass, field
 from enum import Enum
@@ -367,7 +366,7 @@ def apply_patch(value: GValue, patch: Patch) -> GValue:
 
 def _deep_copy_gvalue(v: GValue) -> GValue:
     """Deep copy a GValue."""
-    return copy.deepcopy(v)
+    return v.clone()
 
 
 def _apply_op(v: GValue, op: PatchOp) -> GValue:
@@ -404,9 +403,10 @@ def _apply_op(v: GValue, op: PatchOp) -> GValue:
 
     if v.type == GType.LIST and seg.kind == PathSegKind.LIST_IDX:
         idx = seg.list_idx
-        if idx < 0 or idx >= len(v._list):
+        items = v.as_list()
+        if idx < 0 or idx >= len(items):
             raise ValueError(f"index out of bounds: {idx}")
-        v._list[idx] = _apply_op(v._list[idx], rest_op)
+        items[idx] = _apply_op(items[idx], rest_op)
         return v
 
     raise ValueError(f"cannot navigate {seg.kind.value} in {v.type.value}")
@@ -425,7 +425,7 @@ def _apply_to_parent(v: GValue, seg: PathSeg, op: PatchOp) -> GValue:
         if existing is None:
             _set_field(v, key, GValue.list_(op.value))
         elif existing.type == GType.LIST:
-            existing._list.append(op.value)
+            existing.append(op.value)
         else:
             raise ValueError(f"cannot append to {existing.type.value}")
         return v
@@ -438,10 +438,12 @@ def _apply_to_parent(v: GValue, seg: PathSeg, op: PatchOp) -> GValue:
         existing = _get_field(v, key)
         if existing is None:
             _set_field(v, key, GValue.float_(op.delta))
+        # Replace rather than update in place: scalar GValues may be shared
+        # (e.g. the parser reuses cached tabular cells).
         elif existing.type == GType.INT:
-            existing._int += int(op.delta)
+            _set_field(v, key, GValue.int_(existing.as_int() + int(op.delta)))
         elif existing.type == GType.FLOAT:
-            existing._float += op.delta
+            _set_field(v, key, GValue.float_(existing.as_float() + op.delta))
         else:
             raise ValueError(f"cannot apply delta to {existing.type.value}")
         return v
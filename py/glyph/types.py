@@ -8,7 +8,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 
 class GType(Enum):
@@ -27,7 +27,7 @@ class GType(Enum):
     SUM = "sum"
 
 
-@dataclass
+@dataclass(slots=True)
 class RefID:
     """Reference ID with prefix and value."""
     prefix: str
@@ -39,52 +39,84 @@ class RefID:
         return f"^{self.value}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MapEntry:
     """Key-value pair for maps and structs."""
     key: str
     value: "GValue"
 
 
-@dataclass
+@dataclass(slots=True)
 class StructValue:
     """Struct with type name and fields."""
     type_name: str
     fields: List[MapEntry]
 
 
-@dataclass
+@dataclass(slots=True)
 class SumValue:
     """Tagged union (sum type)."""
     tag: str
     value: Optional["GValue"]
 
 
+# Maps/structs with more entries than this get a key index for get()/set().
+_INDEX_MIN_ENTRIES = 8
+
+# Containers nested deeper than this are copied by _clone_tree() instead of
+# recursing further.
+_CLONE_RECURSION_DEPTH = 100
+
+# Allocate without running __init__; the constructors set every slot.
+_new = object.__new__
+
+
 class GValue:
     """
     Universal value container for GLYPH data.
 
     Supports: null, bool, int, float, str, bytes, time, id, list, map, struct, sum
+
+    Each GType is backed by its own subclass carrying only that type's
+    fields; GValue(gtype) and the constructors below pick the subclass.
+    The constructors allocate it directly and fill in every slot.
     """
 
-    __slots__ = (
-        '_type', '_bool', '_int', '_float', '_str', '_bytes',
-        '_time', '_id', '_list', '_map', '_struct', '_sum',
-    )
-
-    def __init__(self, gtype: GType):
-        self._type = gtype
-        self._bool: Optional[bool] = None
-        self._int: Optional[int] = None
-        self._float: Optional[float] = None
-        self._str: Optional[str] = None
-        self._bytes: Optional[bytes] = None
-        self._time: Optional[datetime] = None
-        self._id: Optional[RefID] = None
-        self._list: Optional[List[GValue]] = None
-        self._map: Optional[List[MapEntry]] = None
-        self._struct: Optional[StructValue] = None
-        self._sum: Optional[SumValue] = None
+    if TYPE_CHECKING:
+        # The per-type fields below live in the subclasses' slots. Type
+        # checkers are shown them on GValue itself, since most code holds a
+        # plain GValue and checks _type before touching them.
+        __slots__ = (
+            '_type', '_bool', '_int', '_float', '_str', '_bytes', '_time', '_id',
+            '_list', '_records', '_map', '_struct', '_sum', '_key_order', '_index', '_canon',
+        )
+        _type: GType
+        _bool: Optional[bool]
+        _int: Optional[int]
+        _float: Optional[float]
+        _str: Optional[str]
+        _bytes: Optional[bytes]
+        _time: Optional[datetime]
+        _id: Optional[RefID]
+        _list: Optional[List[GValue]]
+        _records: Optional[Tuple[Tuple[str, ...], List[List[GValue]]]]
+        _map: Optional[List[MapEntry]]
+        _struct: Optional[StructValue]
+        _sum: Optional[SumValue]
+        _key_order: Optional[Tuple[Tuple[str, ...], List[Tuple[str, int]]]]
+        _index: Optional[Tuple[List[MapEntry], int, Dict[str, int]]]
+        _canon: Optional[str]
+
+        def _clone_nested(self, depth: int) -> GValue: ...
+    else:
+        __slots__ = ('_type',)
+
+    def __new__(cls, gtype: Optional[GType] = None) -> "GValue":
+        if cls is GValue:
+            if gtype not in _GVALUE_CLASSES:
+                raise ValueError(f"unknown type: {gtype}")
+            cls = _GVALUE_CLASSES[gtype]
+        return object.__new__(cls)
 
     @property
     def type(self) -> GType:
@@ -96,77 +128,147 @@ class GValue:
 
     @staticmethod
     def null() -> "GValue":
-        return GValue(GType.NULL)
+        return _NULL
 
     @staticmethod
     def bool_(v: bool) -> "GValue":
-        gv = GValue(GType.BOOL)
+        if v is True:
+            return _TRUE
+        if v is False:
+            return _FALSE
+        gv = _new(_GBool)
+        gv._type = GType.BOOL
         gv._bool = v
         return gv
 
     @staticmethod
     def int_(v: int) -> "GValue":
-        gv = GValue(GType.INT)
-        gv._int = int(v)
+        if type(v) is not int:
+            v = int(v)
+        if -5 <= v <= 256:
+            return _SMALL_INTS[v + 5]
+        gv = _new(_GInt)
+        gv._type = GType.INT
+        gv._int = v
         return gv
 
     @staticmethod
     def float_(v: float) -> "GValue":
-        gv = GValue(GType.FLOAT)
-        gv._float = float(v)
+        gv = _new(_GFloat)
+        gv._type = GType.FLOAT
+        gv._float = v if type(v) is float else float(v)
+        gv._canon = None
         return gv
 
     @staticmethod
     def str_(v: str) -> "GValue":
-        gv = GValue(GType.STR)
+        gv = _new(_GStr)
+        gv._type = GType.STR
         gv._str = v
+        gv._canon = None
         return gv
 
     @staticmethod
     def bytes_(v: bytes) -> "GValue":
-        gv = GValue(GType.BYTES)
+        gv = _new(_GBytes)
+        gv._type = GType.BYTES
         gv._bytes = v
         return gv
 
     @staticmethod
     def time(v: datetime) -> "GValue":
-        gv = GValue(GType.TIME)
+        gv = _new(_GTime)
+        gv._type = GType.TIME
         gv._time = v
+        gv._canon = None
         return gv
 
     @staticmethod
     def id(prefix: str, value: str) -> "GValue":
-        gv = GValue(GType.ID)
+        gv = _new(_GId)
+        gv._type = GType.ID
         gv._id = RefID(prefix, value)
         return gv
 
     @staticmethod
     def id_from_ref(ref: RefID) -> "GValue":
-        gv = GValue(GType.ID)
+        gv = _new(_GId)
+        gv._type = GType.ID
         gv._id = ref
         return gv
 
     @staticmethod
     def list_(*values: "GValue") -> "GValue":
-        gv = GValue(GType.LIST)
+        gv = _new(_GList)
+        gv._type = GType.LIST
         gv._list = list(values)
+        gv._records = None
+        return gv
+
+    @staticmethod
+    def list_from_iter(items: Iterable["GValue"]) -> "GValue":
+        """Create a list from any iterable without varargs unpacking."""
+        gv = _new(_GList)
+        gv._type = GType.LIST
+        gv._list = list(items)
+        gv._records = None
+        return gv
+
+    @staticmethod
+    def list_of_records(columns: Sequence[str], rows: Sequence[Sequence["GValue"]]) -> "GValue":
+        """Create a list of maps that share one key schema, stored column-wise.
+
+        Each row holds one value per column, in column order. The result is an
+        ordinary LIST of MAP values to every accessor, but canonicalization
+        can emit it as @tab directly without probing the rows first.
+        """
+        cols = tuple(columns)
+        if len(set(cols)) != len(cols):
+            raise ValueError("duplicate column name")
+        for row in rows:
+            if len(row) != len(cols):
+                raise ValueError(f"row has {len(row)} values, expected {len(cols)}")
+        gv = GValue(GType.LIST)
+        if rows and cols:
+            gv._records = (cols, [list(col) for col in zip(*rows)])
+        else:
+            # With no columns there is nothing to hold the row count, so
+            # the rows are stored as the empty maps they stand for.
+            gv._list = [GValue.map_() for _ in rows]
         return gv
 
     @staticmethod
     def map_(*entries: MapEntry) -> "GValue":
-        gv = GValue(GType.MAP)
+        gv = _new(_GMap)
+        gv._type = GType.MAP
         gv._map = list(entries)
+        gv._key_order = None
+        gv._index = None
+        return gv
+
+    @staticmethod
+    def map_from_entries(entries: Iterable[MapEntry]) -> "GValue":
+        """Create a map from any iterable of entries without varargs unpacking."""
+        gv = _new(_GMap)
+        gv._type = GType.MAP
+        gv._map = list(entries)
+        gv._key_order = None
+        gv._index = None
         return gv
 
     @staticmethod
     def struct(type_name: str, *fields: MapEntry) -> "GValue":
-        gv = GValue(GType.STRUCT)
+        gv = _new(_GStruct)
+        gv._type = GType.STRUCT
         gv._struct = StructValue(type_name, list(fields))
+        gv._key_order = None
+        gv._index = None
         return gv
 
     @staticmethod
     def sum(tag: str, value: Optional["GValue"]) -> "GValue":
-        gv = GValue(GType.SUM)
+        gv = _new(_GSum)
+        gv._type = GType.SUM
         gv._sum = SumValue(tag, value)
         return gv
 
@@ -215,8 +317,25 @@ class GValue:
     def as_list(self) -> List["GValue"]:
         if self._type != GType.LIST:
             raise TypeError("not a list")
+        if self._records is not None:
+            self._materialize()
         return self._list  # type: ignore
 
+    def columnar(self) -> Optional[Tuple[Tuple[str, ...], List[List["GValue"]]]]:
+        """Get (columns, values) if this list is still stored column-wise, else None."""
+        if self._type != GType.LIST:
+            return None
+        return self._records
+
+    def _materialize(self) -> None:
+        """Convert column-wise record storage into a list of maps."""
+        cols, values = self._records  # type: ignore
+        self._list = [
+            GValue.map_from_entries(map(MapEntry, cols, row))
+            for row in zip(*values)
+        ]
+        self._records = None
+
     def as_map(self) -> List[MapEntry]:
         if self._type != GType.MAP:
             raise TypeError("not a map")
@@ -243,28 +362,49 @@ class GValue:
     def get(self, key: str) -> Optional["GValue"]:
         """Get field from struct or map by key using last-write-wins semantics."""
         if self._type == GType.STRUCT:
-            for f in reversed(self._struct.fields):  # type: ignore
-                if f.key == key:
-                    return f.value
-            return None
-        if self._type == GType.MAP:
-            for e in reversed(self._map):  # type: ignore
-                if e.key == key:
-                    return e.value
+            entries = self._struct.fields  # type: ignore
+        elif self._type == GType.MAP:
+            entries = self._map  # type: ignore
+        else:
             return None
+        if len(entries) > _INDEX_MIN_ENTRIES:
+            i = self._key_index(entries).get(key)
+            if i is None:
+                return None
+            e = entries[i]
+            if e.key != key:
+                # The entry was swapped out in place; reindex once.
+                self._index = None
+                i = self._key_index(entries).get(key)
+                if i is None:
+                    return None
+                e = entries[i]
+            return e.value
+        for e in reversed(entries):
+            if e.key == key:
+                return e.value
         return None
 
+    def _key_index(self, entries: List[MapEntry]) -> Dict[str, int]:
+        """Key -> position of its last entry, cached until the entry list changes."""
+        cached = self._index
+        if cached is None or cached[0] is not entries or cached[1] != len(entries):
+            index = {e.key: i for i, e in enumerate(entries)}
+            cached = self._index = (entries, len(entries), index)
+        return cached[2]
+
     def index(self, i: int) -> "GValue":
         """Get element from list by index."""
-        if self._type != GType.LIST:
-            raise TypeError("not a list")
-        if i < 0 or i >= len(self._list):  # type: ignore
+        items = self.as_list()
+        if i < 0 or i >= len(items):
             raise IndexError("index out of bounds")
-        return self._list[i]  # type: ignore
+        return items[i]
 
     def __len__(self) -> int:
         """Get length of list, map, or struct fields."""
         if self._type == GType.LIST:
+            if self._records is not None:
+                return len(self._records[1][0])
             return len(self._list)  # type: ignore
         if self._type == GType.MAP:
             return len(self._map)  # type: ignore
@@ -279,86 +419,419 @@ class GValue:
     def set(self, key: str, value: "GValue") -> None:
         """Set field on struct or map."""
         if self._type == GType.STRUCT:
-            self._struct.fields = [f for f in self._struct.fields if f.key != key]  # type: ignore
-            self._struct.fields.append(MapEntry(key, value))  # type: ignore
+            entries = self._struct.fields  # type: ignore
         elif self._type == GType.MAP:
-            self._map = [e for e in self._map if e.key != key]  # type: ignore
-            self._map.append(MapEntry(key, value))  # type: ignore
+            entries = self._map  # type: ignore
         else:
             raise TypeError("cannot set on non-struct/map")
+        self._key_order = None
+        if len(entries) > _INDEX_MIN_ENTRIES:
+            index = self._key_index(entries)
+            if key not in index:
+                # New key: append and extend the index instead of copying.
+                entries.append(MapEntry(key, value))
+                index[key] = len(entries) - 1
+                self._index = (entries, len(entries), index)
+                return
+        elif all(e.key != key for e in entries):
+            entries.append(MapEntry(key, value))
+            return
+        # Existing key: drop every entry for it and add a fresh one at the
+        # end. Entries are replaced, never mutated: map_() and
+        # map_from_entries() keep the caller's MapEntry objects.
+        entries = [e for e in entries if e.key != key]
+        entries.append(MapEntry(key, value))
+        if self._type == GType.STRUCT:
+            self._struct.fields = entries  # type: ignore
+        else:
+            self._map = entries
+
+    def reindex(self) -> None:
+        """Drop the cached key index of a map or struct.
+
+        get() and set() keep the index up to date through set() and through
+        entries appended to as_map() / as_struct().fields, but cannot see an
+        entry that is replaced or renamed in place. Call this after doing so.
+        """
+        if self._type == GType.MAP or self._type == GType.STRUCT:
+            self._index = None
 
     def append(self, value: "GValue") -> None:
         """Append to list."""
         if self._type != GType.LIST:
             raise TypeError("cannot append to non-list")
-        self._list.append(value)  # type: ignore
+        self.as_list().append(value)
 
     # ============================================================
     # Deep Copy
     # ============================================================
 
+    # Scalars copy in one step; containers recurse through _clone_nested().
+    _leaf = True
+
     def clone(self) -> "GValue":
         """Create a deep copy of this value."""
-        if self._type == GType.NULL:
-            return GValue.null()
-        elif self._type == GType.BOOL:
-            return GValue.bool_(self._bool)  # type: ignore
-        elif self._type == GType.INT:
-            return GValue.int_(self._int)  # type: ignore
-        elif self._type == GType.FLOAT:
-            return GValue.float_(self._float)  # type: ignore
-        elif self._type == GType.STR:
-            return GValue.str_(self._str)  # type: ignore
-        elif self._type == GType.BYTES:
-            return GValue.bytes_(bytes(self._bytes))  # type: ignore
-        elif self._type == GType.TIME:
-            return GValue.time(self._time)  # type: ignore
-        elif self._type == GType.ID:
-            return GValue.id(self._id.prefix, self._id.value)  # type: ignore
-        elif self._type == GType.LIST:
-            return GValue.list_(*[v.clone() for v in self._list])  # type: ignore
-        elif self._type == GType.MAP:
-            return GValue.map_(*[MapEntry(e.key, e.value.clone()) for e in self._map])  # type: ignore
-        elif self._type == GType.STRUCT:
-            return GValue.struct(
-                self._struct.type_name,  # type: ignore
-                *[MapEntry(f.key, f.value.clone()) for f in self._struct.fields]  # type: ignore
-            )
-        elif self._type == GType.SUM:
-            return GValue.sum(
-                self._sum.tag,  # type: ignore
-                self._sum.value.clone() if self._sum.value else None  # type: ignore
-            )
         raise ValueError(f"unknown type: {self._type}")
 
+    def _shell(self) -> "GValue":
+        """Copy this value, except that a container keeps its original children."""
+        return self.clone()
+
+    def _fill(self, stack: List["GValue"]) -> None:
+        """Replace the children of a _shell() copy with copies of their own.
+
+        Container copies among them are pushed on stack to be filled in turn.
+        """
+
     def __repr__(self) -> str:
-        if self._type == GType.NULL:
-            return "GValue.null()"
-        elif self._type == GType.BOOL:
-            return f"GValue.bool_({self._bool})"
-        elif self._type == GType.INT:
-            return f"GValue.int_({self._int})"
-        elif self._type == GType.FLOAT:
-            return f"GValue.float_({self._float})"
-        elif self._type == GType.STR:
-            return f"GValue.str_({self._str!r})"
-        elif self._type == GType.BYTES:
-            return f"GValue.bytes_({self._bytes!r})"
-        elif self._type == GType.TIME:
-            return f"GValue.time({self._time!r})"
-        elif self._type == GType.ID:
-            return f"GValue.id({self._id.prefix!r}, {self._id.value!r})"
-        elif self._type == GType.LIST:
-            return f"GValue.list_({', '.join(repr(v) for v in self._list)})"  # type: ignore
-        elif self._type == GType.MAP:
-            return f"GValue.map_(...)"
-        elif self._type == GType.STRUCT:
-            return f"GValue.struct({self._struct.type_name!r}, ...)"  # type: ignore
-        elif self._type == GType.SUM:
-            return f"GValue.sum({self._sum.tag!r}, ...)"  # type: ignore
         return f"GValue({self._type})"
 
 
+# ============================================================
+# Per-type storage
+# ============================================================
+
+class _GNull(GValue):
+    __slots__ = ()
+
+    def __init__(self, gtype: GType = GType.NULL):
+        self._type = gtype
+
+    def clone(self) -> GValue:
+        return GValue.null()
+
+    def __repr__(self) -> str:
+        return "GValue.null()"
+
+
+class _GBool(GValue):
+    __slots__ = ('_bool',)
+
+    def __init__(self, gtype: GType = GType.BOOL):
+        self._type = gtype
+        self._bool: Optional[bool] = None
+
+    def clone(self) -> GValue:
+        return GValue.bool_(self._bool)  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"GValue.bool_({self._bool})"
+
+
+class _GInt(GValue):
+    __slots__ = ('_int',)
+
+    def __init__(self, gtype: GType = GType.INT):
+        self._type = gtype
+        self._int: Optional[int] = None
+
+    def clone(self) -> GValue:
+        return GValue.int_(self._int)  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"GValue.int_({self._int})"
+
+
+class _GFloat(GValue):
+    __slots__ = ('_float', '_canon')
+
+    def __init__(self, gtype: GType = GType.FLOAT):
+        self._type = gtype
+        self._float: Optional[float] = None
+        # Canonical text, filled in by the canonicalizer on first use. The
+        # payload never changes after construction, so it stays valid.
+        self._canon: Optional[str] = None
+
+    def clone(self) -> GValue:
+        return GValue.float_(self._float)  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"GValue.float_({self._float})"
+
+
+class _GStr(GValue):
+    __slots__ = ('_str', '_canon')
+
+    def __init__(self, gtype: GType = GType.STR):
+        self._type = gtype
+        self._str: Optional[str] = None
+        self._canon: Optional[str] = None  # see _GFloat
+
+    def clone(self) -> GValue:
+        return GValue.str_(self._str)  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"GValue.str_({self._str!r})"
+
+
+class _GBytes(GValue):
+    __slots__ = ('_bytes',)
+
+    def __init__(self, gtype: GType = GType.BYTES):
+        self._type = gtype
+        self._bytes: Optional[bytes] = None
+
+    def clone(self) -> GValue:
+        return GValue.bytes_(bytes(self._bytes))  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"GValue.bytes_({self._bytes!r})"
+
+
+class _GTime(GValue):
+    __slots__ = ('_time', '_canon')
+
+    def __init__(self, gtype: GType = GType.TIME):
+        self._type = gtype
+        self._time: Optional[datetime] = None
+        self._canon: Optional[str] = None  # see _GFloat
+
+    def clone(self) -> GValue:
+        return GValue.time(self._time)  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"GValue.time({self._time!r})"
+
+
+class _GId(GValue):
+    __slots__ = ('_id',)
+
+    def __init__(self, gtype: GType = GType.ID):
+        self._type = gtype
+        self._id: Optional[RefID] = None
+
+    def clone(self) -> GValue:
+        return GValue.id(self._id.prefix, self._id.value)  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"GValue.id({self._id.prefix!r}, {self._id.value!r})"  # type: ignore
+
+
+class _GList(GValue):
+    __slots__ = ('_list', '_records')
+
+    def __init__(self, gtype: GType = GType.LIST):
+        self._type = gtype
+        self._list: Optional[List[GValue]] = None
+        # Column-wise storage for lists built by list_of_records():
+        # (columns, values) with values[col_idx][row_idx]. While set, _list is
+        # None; the first row-wise access materializes it and clears this.
+        self._records: Optional[Tuple[Tuple[str, ...], List[List[GValue]]]] = None
+
+    _leaf = False
+
+    def clone(self) -> GValue:
+        return self._clone_nested(0)
+
+    def _clone_nested(self, depth: int) -> GValue:
+        if depth >= _CLONE_RECURSION_DEPTH:
+            return _clone_tree(self)
+        depth += 1
+        if self._records is not None:
+            cols, values = self._records
+            gv = GValue(GType.LIST)
+            gv._records = (cols, [
+                [v.clone() if v._leaf else v._clone_nested(depth) for v in col]
+                for col in values
+            ])
+            return gv
+        gv = GValue.list_()
+        gv._list = [v.clone() if v._leaf else v._clone_nested(depth) for v in self._list]  # type: ignore
+        return gv
+
+    def _shell(self) -> GValue:
+        if self._records is not None:
+            cols, values = self._records
+            gv = GValue(GType.LIST)
+            gv._records = (cols, [list(col) for col in values])
+            return gv
+        return GValue.list_from_iter(self._list)  # type: ignore
+
+    def _fill(self, stack: List[GValue]) -> None:
+        if self._records is not None:
+            for col in self._records[1]:
+                _fill_values(col, stack)
+        else:
+            _fill_values(self._list, stack)  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"GValue.list_({', '.join(repr(v) for v in self.as_list())})"
+
+
+class _GMap(GValue):
+    __slots__ = ('_map', '_key_order', '_index')
+
+    def __init__(self, gtype: GType = GType.MAP):
+        self._type = gtype
+        self._map: Optional[List[MapEntry]] = None
+        # Canonical key order, cached by the canonicalizer as
+        # (keys, [(canonical_key, entry_index), ...]). Only trusted while
+        # keys still matches the current entry keys.
+        self._key_order: Optional[Tuple[Tuple[str, ...], List[Tuple[str, int]]]] = None
+        # Key -> position of its last entry, built by get() for large maps as
+        # (entries, len(entries), index) and trusted only while the entry
+        # list is the same object with the same length.
+        self._index: Optional[Tuple[List[MapEntry], int, Dict[str, int]]] = None
+
+    _leaf = False
+
+    def clone(self) -> GValue:
+        return self._clone_nested(0)
+
+    def _clone_nested(self, depth: int) -> GValue:
+        if depth >= _CLONE_RECURSION_DEPTH:
+            return _clone_tree(self)
+        depth += 1
+        gv = GValue.map_()
+        gv._map = [  # type: ignore
+            MapEntry(e.key, e.value.clone() if e.value._leaf else e.value._clone_nested(depth))
+            for e in self._map  # type: ignore
+        ]
+        return gv
+
+    def _shell(self) -> GValue:
+        return GValue.map_from_entries([MapEntry(e.key, e.value) for e in self._map])  # type: ignore
+
+    def _fill(self, stack: List[GValue]) -> None:
+        _fill_entries(self._map, stack)  # type: ignore
+
+    def __repr__(self) -> str:
+        return "GValue.map_(...)"
+
+
+class _GStruct(GValue):
+    __slots__ = ('_struct', '_key_order', '_index')
+
+    def __init__(self, gtype: GType = GType.STRUCT):
+        self._type = gtype
+        self._struct: Optional[StructValue] = None
+        # Canonical key order and key index of the fields; see _GMap.
+        self._key_order: Optional[Tuple[Tuple[str, ...], List[Tuple[str, int]]]] = None
+        self._index: Optional[Tuple[List[MapEntry], int, Dict[str, int]]] = None
+
+    _leaf = False
+
+    def clone(self) -> GValue:
+        return self._clone_nested(0)
+
+    def _clone_nested(self, depth: int) -> GValue:
+        if depth >= _CLONE_RECURSION_DEPTH:
+            return _clone_tree(self)
+        depth += 1
+        gv = GValue.struct(self._struct.type_name)  # type: ignore
+        gv._struct.fields = [  # type: ignore
+            MapEntry(f.key, f.value.clone() if f.value._leaf else f.value._clone_nested(depth))
+            for f in self._struct.fields  # type: ignore
+        ]
+        return gv
+
+    def _shell(self) -> GValue:
+        gv = GValue.struct(self._struct.type_name)  # type: ignore
+        gv._struct.fields = [MapEntry(f.key, f.value) for f in self._struct.fields]  # type: ignore
+        return gv
+
+    def _fill(self, stack: List[GValue]) -> None:
+        _fill_entries(self._struct.fields, stack)  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"GValue.struct({self._struct.type_name!r}, ...)"  # type: ignore
+
+
+class _GSum(GValue):
+    __slots__ = ('_sum',)
+
+    def __init__(self, gtype: GType = GType.SUM):
+        self._type = gtype
+        self._sum: Optional[SumValue] = None
+
+    _leaf = False
+
+    def clone(self) -> GValue:
+        return self._clone_nested(0)
+
+    def _clone_nested(self, depth: int) -> GValue:
+        if depth >= _CLONE_RECURSION_DEPTH:
+            return _clone_tree(self)
+        value = self._sum.value  # type: ignore
+        if value is not None:
+            value = value.clone() if value._leaf else value._clone_nested(depth + 1)
+        return GValue.sum(self._sum.tag, value)  # type: ignore
+
+    def _shell(self) -> GValue:
+        return GValue.sum(self._sum.tag, self._sum.value)  # type: ignore
+
+    def _fill(self, stack: List[GValue]) -> None:
+        value = self._sum.value  # type: ignore
+        if value is not None:
+            value = self._sum.value = value._shell()  # type: ignore
+            if not value._leaf:
+                stack.append(value)
+
+    def __repr__(self) -> str:
+        return f"GValue.sum({self._sum.tag!r}, ...)"  # type: ignore
+
+
+def _clone_tree(root: GValue) -> GValue:
+    """Deep-copy a container value with an explicit work stack.
+
+    Nesting depth is bounded by memory rather than the recursion limit.
+    """
+    top = root._shell()
+    stack = [top]
+    pop = stack.pop
+    while stack:
+        pop()._fill(stack)
+    return top
+
+
+def _fill_values(values: List[GValue], stack: List[GValue]) -> None:
+    push = stack.append
+    for i, v in enumerate(values):
+        v = values[i] = v._shell()
+        if not v._leaf:
+            push(v)
+
+
+def _fill_entries(entries: List[MapEntry], stack: List[GValue]) -> None:
+    push = stack.append
+    for e in entries:
+        v = e.value = e.value._shell()
+        if not v._leaf:
+            push(v)
+
+
+_GVALUE_CLASSES = {
+    GType.NULL: _GNull,
+    GType.BOOL: _GBool,
+    GType.INT: _GInt,
+    GType.FLOAT: _GFloat,
+    GType.STR: _GStr,
+    GType.BYTES: _GBytes,
+    GType.TIME: _GTime,
+    GType.ID: _GId,
+    GType.LIST: _GList,
+    GType.MAP: _GMap,
+    GType.STRUCT: _GStruct,
+    GType.SUM: _GSum,
+}
+
+
+def _interned(cls: type, gtype: GType, **fields: object) -> GValue:
+    gv: GValue = _new(cls)
+    gv._type = gtype
+    for name, value in fields.items():
+        setattr(gv, name, value)
+    return gv
+
+
+# Shared instances for null, the booleans and small ints, the values tabular
+# and JSON payloads repeat most. Scalars are never modified in place, so
+# handing out the same object is safe; clone() returns them too.
+_NULL = _interned(_GNull, GType.NULL)
+_TRUE = _interned(_GBool, GType.BOOL, _bool=True)
+_FALSE = _interned(_GBool, GType.BOOL, _bool=False)
+_SMALL_INTS = tuple(_interned(_GInt, GType.INT, _int=i) for i in range(-5, 257))
+
 # ============================================================
 # Helper Functions
 # ============================================================
@@ -412,6 +885,11 @@ class G:
     def map(*entries: MapEntry) -> GValue:
         return GValue.map_(*entries)
 
+    @staticmethod
+    def map_from_entries(entries: Iterable[MapEntry]) -> "GValue":
+        """Create a map from any iterable of entries without varargs unpacking."""
+        return GValue.map_from_entries(entries)
+
     @staticmethod
     def struct(type_name: str, *fields: MapEntry) -> GValue:
         return GValue.struct(type_name, *fields)
@@ -14,6 +14,7 @@ from glyph import (
     canonicalize_loose,
     equal_loose,
     fingerprint_loose,
+    fingerprint_loose_batch,
     LooseCanonOpts, NullStyle,
 )
 
@@ -97,6 +98,51 @@ class TestGValue:
         )
         assert v.get("home").as_str() == "Arsenal"
 
+    def test_per_type_storage(self):
+        import copy
+        v = GValue.int_(5)
+        assert isinstance(v, GValue)
+        assert not hasattr(v, "_str")
+        with pytest.raises(TypeError, match="not a str"):
+            v.as_str()
+        m = GValue(GType.MAP)
+        assert m.type == GType.MAP and m.as_map() is None
+        doc = g.struct("T", field("xs", g.list(g.int(1), g.str("a"))))
+        assert equal_loose(copy.deepcopy(doc), doc)
+        assert equal_loose(doc.clone(), doc)
+        with pytest.raises(ValueError, match="unknown type"):
+            GValue("nope")
+
+    def test_interned_scalars(self):
+        assert GValue.null() is GValue.null()
+        assert GValue.bool_(True) is GValue.bool_(True)
+        assert GValue.int_(7) is GValue.int_(7.0)
+        assert GValue.int_(7).clone() is GValue.int_(7)
+        assert GValue.int_(100000).as_int() == 100000
+        assert GValue.int_(True).as_int() == 1
+        assert GValue.bool_(1).as_bool() == 1
+
+    def test_numeric_constructors_coerce(self):
+        assert type(GValue.int_(10**20).as_int()) is int
+        assert type(GValue.int_(True).as_int()) is int
+        assert type(GValue.float_(2).as_float()) is float
+        assert GValue.float_("1.5").as_float() == 1.5
+
+    def test_clone_deep_nesting(self):
+        v = g.int(1)
+        for i in range(5000):
+            v = g.list(v) if i % 2 else g.map(field("k", v))
+        c = v.clone()
+        for i in reversed(range(5000)):
+            assert c is not v
+            v = v.index(0) if i % 2 else v.get("k")
+            c = c.index(0) if i % 2 else c.get("k")
+        assert c.as_int() == 1
+
+    def test_clone_sum_keeps_scalar_payload(self):
+        c = GValue.sum("Some", g.int(5)).clone()
+        assert c.as_sum().value.as_int() == 5
+
 
 class TestCanonicalizeLoose:
     """Tests for loose canonicalization."""
@@ -108,10 +154,36 @@ class TestCanonicalizeLoose:
         opts = LooseCanonOpts(null_style=NullStyle.SYMBOL)
         assert canonicalize_loose(GValue.null(), opts) == "∅"
 
+    def test_null_unknown_style_falls_back_to_symbol(self):
+        from glyph.loose import canon_null
+        assert canon_null(None) == "∅"
+        opts = LooseCanonOpts(null_style=None)
+        assert canonicalize_loose(GValue.null(), opts) == "∅"
+        rows = g.list(*[g.map(field("a", g.null()), field("b", g.int(i))) for i in range(3)])
+        assert "|∅|" in canonicalize_loose(rows, opts)
+
     def test_bool(self):
         assert emit(GValue.bool_(True)) == "t"
         assert emit(GValue.bool_(False)) == "f"
 
+    def test_repeated_emit_of_shared_scalars(self):
+        s = g.str("hello world " * 10)
+        x = g.float(1e21)
+        t = g.time(datetime(2025, 1, 13, 12, 0, tzinfo=timezone.utc))
+        doc = g.list(s, x, t, s, x, t)
+        first = emit(doc)
+        assert emit(doc) == first
+        assert first.count('"hello world') == 2 and first.count("1e+21") == 2
+        # Long strings are re-encoded rather than keeping a second copy.
+        assert s._canon is None
+        assert emit(t) == "2025-01-13T12:00:00Z"
+
+    def test_list_of_scalars_then_containers(self):
+        assert emit(g.list(g.int(1), g.float(2.5), g.str("a b"))) == '[1 2.5 "a b"]'
+        doc = g.list(g.int(1), g.int(2), g.list(g.int(3)), g.int(4), g.map(field("k", g.null())))
+        assert emit(doc) == "[1 2 [3] 4 {k=_}]"
+        assert emit(g.list(g.list(), g.int(1))) == "[[] 1]"
+
     def test_int(self):
         assert emit(GValue.int_(42)) == "42"
         assert emit(GValue.int_(0)) == "0"
@@ -154,6 +226,14 @@ class TestCanonicalizeLoose:
         # Keys should be sorted
         assert emit(v) == "{a=1 m=2 z=3}"
 
+    def test_map_sorted_after_mutation(self):
+        # Large enough to use the cached key order; it must follow mutations.
+        v = GValue.map_(*[MapEntry(f"k{i}", GValue.int_(i)) for i in range(9, -1, -1)])
+        assert emit(v) == "{" + " ".join(f"k{i}={i}" for i in range(10)) + "}"
+        v.set("a", GValue.int_(-1))
+        v.as_map()[0] = MapEntry("zz", GValue.int_(99))
+        assert emit(v) == "{a=-1 " + " ".join(f"k{i}={i}" for i in range(9)) + " zz=99}"
+
     def test_struct(self):
         v = GValue.struct("Team",
             MapEntry("name", GValue.str_("Arsenal")),
@@ -260,6 +340,30 @@ class TestJSONBridge:
         with pytest.raises(ValueError, match="non-finite"):
             to_json(GValue.float_(float("nan")))
 
+    def test_repeated_keys_shared_without_interning(self):
+        import json
+        from glyph import loose
+        data = json.loads('[{"zq_json_key": 1, "n": 1}, {"n": 2, "zq_json_key": 2}]')
+        first, second = from_json(data).as_list()
+        assert first.as_map()[0].key is second.as_map()[1].key
+        probe = "".join(["zq_json", "_key"])
+        assert sys.intern(probe) is probe
+        # The table is bounded rather than growing with every distinct key.
+        from_json({f"k{i}": i for i in range(loose._SHARED_KEYS_MAX + 10)})
+        assert len(loose._shared_keys) <= loose._SHARED_KEYS_MAX
+
+    def test_parse_json_beyond_strict_decoders(self):
+        from glyph.loose import parse_json_loose
+        # Integers beyond 64 bits and lone surrogates are valid for the
+        # standard library decoder, whichever decoder runs first.
+        v = parse_json_loose('{"n": 123456789012345678901234567890, "s": "\\ud800"}')
+        assert v.get("n").as_float() == 1.2345678901234568e29
+        assert v.get("s").as_str() == "\ud800"
+        with pytest.raises(ValueError, match="non-finite"):
+            parse_json_loose("[NaN]")
+        with pytest.raises(ValueError):
+            parse_json_loose("[1,")
+
 
 class TestParserHardening:
     """Regression tests for malformed input handling."""
@@ -312,6 +416,45 @@ class TestDuplicateKeySemantics:
         assert len(v.as_map()) == 1
         assert v.get("a").as_int() == 3
 
+    def test_large_map_get_and_set(self):
+        # Past the size where get()/set() use a key index.
+        entries = [MapEntry(f"k{i}", GValue.int_(i)) for i in range(20)]
+        entries.append(MapEntry("k3", GValue.int_(-3)))
+        v = GValue.map_(*entries)
+        assert v.get("k3").as_int() == -3
+        assert v.get("missing") is None
+        v.set("new", GValue.int_(100))
+        assert v.get("new").as_int() == 100
+        v.set("k3", GValue.int_(33))
+        assert v.get("k3").as_int() == 33
+        assert [e.key for e in v.as_map()].count("k3") == 1
+        v.as_map()[0] = MapEntry("k0", GValue.int_(-1))
+        assert v.get("k0").as_int() == -1
+
+    def test_large_map_get_after_in_place_edits(self):
+        v = GValue.map_(*[MapEntry(f"k{i}", GValue.int_(i)) for i in range(20)])
+        assert v.get("k1").as_int() == 1  # builds the key index
+        v.as_map()[1] = MapEntry("new", GValue.int_(100))
+        assert v.get("k1") is None  # a stale hit is caught without reindex()
+        v.as_map()[2].key = "renamed"
+        v.reindex()
+        assert v.get("new").as_int() == 100
+        assert v.get("renamed").as_int() == 2
+        assert v.get("k2") is None
+        v.set("renamed", GValue.int_(-2))
+        assert [e.key for e in v.as_map()].count("renamed") == 1
+        assert v.get("renamed").as_int() == -2
+        v.as_map().append(MapEntry("tail", GValue.int_(7)))
+        assert v.get("tail").as_int() == 7
+
+    def test_large_map_build_with_get_then_set(self):
+        v = GValue.map_(*[MapEntry(f"k{i}", GValue.int_(i)) for i in range(20)])
+        for i in range(2000):
+            if v.get(f"n{i}") is None:
+                v.set(f"n{i}", GValue.int_(i))
+        assert len(v) == 2020 and v.get("n1999").as_int() == 1999
+        assert v.get("missing") is None
+
 
 class TestFingerprint:
     """Tests for fingerprinting."""
@@ -336,6 +479,31 @@ class TestFingerprint:
         )
         assert fingerprint_loose(v1) == fingerprint_loose(v2)
 
+    def test_equal_loose_across_types(self):
+        assert not equal_loose(GValue.int_(1), GValue.float_(1.5))
+        assert not equal_loose(GValue.str_("t"), GValue.bool_(True))
+        # A struct with an empty type name canonicalizes exactly like a map.
+        entry = MapEntry("a", GValue.int_(1))
+        assert equal_loose(GValue.struct("", entry), GValue.map_(entry))
+
+    def test_equal_loose_large_values(self):
+        data = [{"id": i, "tags": ["x", "y"]} for i in range(3000)]
+        changed = [dict(row) for row in data]
+        changed[-1] = {"id": -1, "tags": ["x", "y"]}
+        assert equal_loose(from_json(data), from_json(data))
+        assert not equal_loose(from_json(data), from_json(changed))
+        assert not equal_loose(from_json(data), from_json(data[:-1]))
+
+    def test_fingerprint_batch_matches_single(self):
+        values = [
+            GValue.int_(1),
+            GValue.null(),
+            GValue.map_(MapEntry("b", GValue.int_(2)), MapEntry("a", GValue.str_("x y"))),
+            from_json([{"id": 1}, {"id": 2}, {"id": 3}]),
+        ]
+        assert fingerprint_loose_batch(values) == [fingerprint_loose(v) for v in values]
+        assert fingerprint_loose_batch([]) == []
+
 
 class TestAutoTabular:
     """Tests for auto-tabular mode."""
@@ -361,6 +529,42 @@ class TestAutoTabular:
         v = parse(text)
         assert len(v) == 3
 
+    def test_list_of_records_matches_row_form(self):
+        rows = [[GValue.str_("Alice"), GValue.int_(30)],
+                [GValue.str_("Bob"), GValue.int_(25)],
+                [GValue.str_("Carol"), GValue.int_(35)]]
+        columnar = GValue.list_of_records(["name", "age"], rows)
+        row_form = GValue.list_(*[
+            GValue.map_(MapEntry("name", r[0]), MapEntry("age", r[1])) for r in rows
+        ])
+        assert emit(columnar) == emit(row_form)
+        assert canonicalize_loose(columnar, LooseCanonOpts(auto_tabular=False)) == \
+            canonicalize_loose(row_form, LooseCanonOpts(auto_tabular=False))
+        assert len(columnar) == 3
+
+    def test_from_json_record_list_is_columnar(self):
+        data = [{"id": i, "name": f"user{i}"} for i in range(5)]
+        v = from_json(data)
+        assert v.columnar() is not None
+        assert v.index(2).get("name").as_str() == "user2"
+        assert v.columnar() is None  # materialized on row access
+        assert to_json(v) == data
+
+    def test_from_json_mixed_schema_stays_row_wise(self):
+        v = from_json([{"a": 1}, {"b": 2}, {"a": 3}])
+        assert v.columnar() is None
+
+    def test_list_of_records_rejects_ragged_rows(self):
+        with pytest.raises(ValueError, match="expected 2"):
+            GValue.list_of_records(["a", "b"], [[GValue.int_(1)]])
+
+    def test_list_of_records_without_columns(self):
+        v = GValue.list_of_records([], [[], [], []])
+        assert len(v) == 3
+        assert emit(v) == "[{} {} {}]"
+        assert [len(m) for m in v.as_list()] == [0, 0, 0]
+        assert len(GValue.list_of_records([], [])) == 0
+
     def test_quotes_numeric_keyword_strings(self):
         assert emit(GValue.str_("Inf")) == '"Inf"'
         assert emit(GValue.str_("NaN")) == '"NaN"'
@@ -389,6 +593,13 @@ class TestParseEdgeCases:
         # Unknown escape: just pass through the char
         assert parse(r'"he\xllo"').as_str() == "hexllo"
 
+    def test_string_escape_runs(self):
+        # Escapes back to back, an escaped quote before the closing one, and
+        # plain runs on both sides.
+        assert parse(r'"\"\\\n"').as_str() == '"\\\n'
+        assert parse(r'"ab\"cd\""').as_str() == 'ab"cd"'
+        assert parse('"' + "x" * 1000 + '\\n' + "y" * 1000 + '"').as_str() == "x" * 1000 + "\n" + "y" * 1000
+
     def test_invalid_unicode_escape(self):
         with pytest.raises(ValueError, match="invalid unicode escape"):
             parse('"\\u00"')
@@ -563,6 +774,22 @@ class TestParseEdgeCases:
         assert lst[0].get("name").as_str() == "Alice"
         assert lst[0].get("age").as_int() == 30
 
+    def test_repeated_keys_shared_within_a_parse_only(self):
+        v = parse("[{zq_probe_key=1} {zq_probe_key=2}]")
+        a, b = (m.as_map()[0].key for m in v.as_list())
+        assert a is b
+        # Not interned process-wide: a fresh copy interns as itself.
+        probe = "".join(["zq_probe", "_key"])
+        assert sys.intern(probe) is probe
+
+    def test_tabular_id_cells_not_shared_across_parses(self):
+        text = "@tab _ [x]\n|^u:1|\n|^u:1|\n@end"
+        first = parse(text)
+        first.index(0).get("x").as_id().value = "HACK"
+        second = parse(text)
+        assert [r.get("x").as_id().value for r in second.as_list()] == ["1", "1"]
+        assert first.index(1).get("x").as_id().value == "1"
+
     def test_tabular_null_placeholder(self):
         text = "@tab ∅ [x y]\n|1|2|\n|3|4|\n@end"
         v = parse(text)
@@ -594,6 +821,22 @@ class TestParseEdgeCases:
         v = parse(text)
         assert v.as_list()[0].get("x").as_str() == "line1\nline2"
 
+    def test_tabular_cell_escaped_pipe(self):
+        # An escaped pipe stays in the cell; an escaped backslash before a
+        # pipe does not escape it.
+        text = '@tab _ [x y]\n|"a\\|b"|"c\\\\\\\\"|\n@end'
+        row = parse(text).as_list()[0]
+        assert row.get("x").as_str() == "a|b"
+        assert row.get("y").as_str() == "c\\"
+
+    def test_tabular_repeated_cells(self):
+        text = "@tab _ [s n l]\n|ok|1|[1]|\n|ok|1|[1]|\n@end"
+        r0, r1 = parse(text).as_list()
+        assert r0.get("s").as_str() == r1.get("s").as_str() == "ok"
+        assert r0.get("n").as_int() == r1.get("n").as_int() == 1
+        # Containers are never shared between rows
+        assert r0.get("l") is not r1.get("l")
+
     def test_tabular_eof_without_end(self):
         text = "@tab _ [x]\n|1|\n|2|\n|3|"
         v = parse(text)
@@ -735,6 +978,17 @@ class TestLooseEdgeCases:
         assert ".123" in result
         assert result.endswith("Z")
 
+    def test_canon_time_converts_offset_to_utc(self):
+        from glyph.loose import canon_time
+        from datetime import timedelta
+        dt = datetime(2025, 1, 13, 14, 30, 0, tzinfo=timezone(timedelta(hours=2)))
+        assert canon_time(dt) == "2025-01-13T12:30:00Z"
+
+    def test_canon_time_pads_year(self):
+        from glyph.loose import canon_time
+        dt = datetime(999, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert canon_time(dt) == "0999-01-02T03:04:05Z"
+
     def test_canon_id_safe(self):
         from glyph.loose import canon_id
         from glyph import RefID
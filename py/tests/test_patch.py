@@ -625,6 +625,14 @@ class TestApplyDelta:
         result = apply_patch(doc, patch)
         assert result.get("counter").as_int() == 7
 
+    def test_delta_leaves_shared_value_alone(self):
+        shared = GValue.int_(10)
+        doc = GValue.map_(MapEntry("a", shared), MapEntry("b", shared))
+        patch = parse_patch("@patch\n~ .a +5\n@end")
+        result = apply_patch(doc, patch)
+        assert result.get("a").as_int() == 15
+        assert result.get("b").as_int() == 10
+
 
 # ============================================================
 # apply_patch — nested navigation
@@ -6,6 +6,7 @@ Python, Go, JavaScript, Rust, and C
 
 import subprocess
 import json
+import struct
 import sys
 import os
 
@@ -66,26 +67,43 @@ def ensure_go_bin():
 package main
 
 import (
-    "fmt"
+    "bufio"
+    "encoding/binary"
     "io"
     "os"
     glyph "github.com/Neumenon/glyph/glyph"
 )
 
+// Reads length-prefixed JSON frames (4-byte little-endian length, then the
+// bytes) from stdin and writes one canonical frame back per input.
 func main() {
-    var input []byte
-    if len(os.Args) > 1 {
-        input = []byte(os.Args[1])
-    } else {
-        data, _ := io.ReadAll(os.Stdin)
-        input = data
+    in := bufio.NewReader(os.Stdin)
+    out := bufio.NewWriter(os.Stdout)
+    defer out.Flush()
+    var size [4]byte
+    for {
+        if _, err := io.ReadFull(in, size[:]); err != nil {
+            return
+        }
+        input := make([]byte, binary.LittleEndian.Uint32(size[:]))
+        if _, err := io.ReadFull(in, input); err != nil {
+            result := "ERROR: truncated frame"
+            binary.LittleEndian.PutUint32(size[:], uint32(len(result)))
+            out.Write(size[:])
+            out.WriteString(result)
+            return
+        }
+        var result string
+        v, err := glyph.FromJSONLoose(input)
+        if err != nil {
+            result = "ERROR: " + err.Error()
+        } else {
+            result = glyph.CanonicalizeLoose(v)
+        }
+        binary.LittleEndian.PutUint32(size[:], uint32(len(result)))
+        out.Write(size[:])
+        out.WriteString(result)
     }
-    v, err := glyph.FromJSONLoose(input)
-    if err != nil {
-        fmt.Fprint(os.Stderr, err)
-        os.Exit(1)
-    }
-    fmt.Print(glyph.CanonicalizeLoose(v))
 }
 '''
     with open(main_path, "w") as f:
@@ -124,17 +142,33 @@ glyph_codec = {{ package = "glyph-rs", path = "{RUST_PATH}" }}
 '''
 
     main_rs = r'''
-use std::io::{self, Read};
+use std::io::{self, Read, Write};
 use glyph_codec::{parse_json, canonicalize_loose};
 
+// Reads length-prefixed JSON frames (4-byte little-endian length, then the
+// bytes) from stdin and writes one canonical frame back per input.
 fn main() {
-    let input = std::env::args().nth(1).unwrap_or_else(|| {
-        let mut s = String::new();
-        io::stdin().read_to_string(&mut s).unwrap();
-        s
-    });
-    let v = parse_json(&input).unwrap();
-    print!("{}", canonicalize_loose(&v).unwrap());
+    let mut stdin = io::stdin().lock();
+    let mut out = io::BufWriter::new(io::stdout().lock());
+    let mut size = [0u8; 4];
+    while stdin.read_exact(&mut size).is_ok() {
+        let mut input = vec![0u8; u32::from_le_bytes(size) as usize];
+        let truncated = stdin.read_exact(&mut input).is_err();
+        let result = if truncated {
+            "ERROR: truncated frame".to_string()
+        } else {
+            match parse_json(&String::from_utf8_lossy(&input)).and_then(|v| canonicalize_loose(&v)) {
+                Ok(canon) => canon,
+                Err(e) => format!("ERROR: {:?}", e),
+            }
+        };
+        if out.write_all(&(result.len() as u32).to_le_bytes()).is_err()
+            || out.write_all(result.as_bytes()).is_err()
+            || truncated
+        {
+            break;
+        }
+    }
 }
 '''
 
@@ -169,23 +203,44 @@ def ensure_c_bin():
 
     c_code = r'''
 #include "glyph.h"
+#include <stdint.h>
 #include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+static void write_frame(const char *s) {
+    uint32_t n = (uint32_t)strlen(s);
+    unsigned char size[4] = {n & 0xff, (n >> 8) & 0xff, (n >> 16) & 0xff, (n >> 24) & 0xff};
+    fwrite(size, 1, 4, stdout);
+    fwrite(s, 1, n, stdout);
+}
 
-int main(int argc, char **argv) {
-    if (argc < 2) {
-        return 1;
-    }
-    const char *json = argv[1];
-    glyph_value_t *v = glyph_from_json(json);
-    if (!v) {
-        return 1;
-    }
-    char *canon = glyph_canonicalize_loose(v);
-    if (canon) {
-        printf("%s", canon);
-        glyph_free(canon);
+/* Reads length-prefixed JSON frames (4-byte little-endian length, then the
+ * bytes) from stdin and writes one canonical frame back per input. */
+int main(void) {
+    unsigned char size[4];
+    while (fread(size, 1, 4, stdin) == 4) {
+        uint32_t n = size[0] | (size[1] << 8) | (size[2] << 16) | ((uint32_t)size[3] << 24);
+        char *json = malloc(n + 1);
+        if (!json || fread(json, 1, n, stdin) != n) {
+            write_frame(json ? "ERROR: truncated frame" : "ERROR: out of memory");
+            free(json);
+            break;
+        }
+        json[n] = '\0';
+        glyph_value_t *v = glyph_from_json(json);
+        free(json);
+        if (!v) {
+            write_frame("ERROR: invalid JSON");
+            continue;
+        }
+        char *canon = glyph_canonicalize_loose(v);
+        write_frame(canon ? canon : "");
+        if (canon) {
+            glyph_free(canon);
+        }
+        glyph_value_free(v);
     }
-    glyph_value_free(v);
     return 0;
 }
 '''
@@ -238,80 +293,122 @@ def get_python_output(json_str):
     return canonicalize_loose(v)
 
 
-def get_go_output(json_str):
-    """Get GLYPH output from Go implementation"""
-    try:
-        bin_path = ensure_go_bin()
-    except Exception as exc:
-        return f"ERROR: {exc}"
-
+def encode_frames(strs):
+    """Concatenate strs as frames: 4-byte little-endian length, then UTF-8 bytes."""
+    frames = []
+    for s in strs:
+        data = s.encode("utf-8")
+        frames.append(struct.pack("<I", len(data)))
+        frames.append(data)
+    return b"".join(frames)
+
+
+def decode_frames(data):
+    """Split a buffer written by encode_frames (or a worker) back into strs."""
+    strs = []
+    pos = 0
+    while pos + 4 <= len(data):
+        (size,) = struct.unpack_from("<I", data, pos)
+        pos += 4
+        if pos + size > len(data):
+            break  # cut off mid-frame: the writer stopped
+        strs.append(data[pos:pos + size].decode("utf-8", "replace"))
+        pos += size
+    return strs
+
+
+def run_batch(cmd, json_strs, **kwargs):
+    """Run cmd once for the whole table, exchanging length-prefixed frames.
+
+    All inputs are written to stdin in one buffer and the program answers
+    with one frame per input, so each implementation starts once instead of
+    once per case, and no delimiter has to be kept out of the payloads.
+    """
     result = subprocess.run(
-        [bin_path, json_str],
+        cmd,
+        input=encode_frames(json_strs),
         capture_output=True,
-        text=True,
+        **kwargs,
     )
+    outputs = decode_frames(result.stdout)
+    if len(outputs) > len(json_strs):
+        return [f"ERROR: expected {len(json_strs)} outputs, got {len(outputs)}"] * len(json_strs)
     if result.returncode != 0:
-        return f"ERROR: {result.stderr}"
-    return result.stdout
+        # Frames written before the program died are still valid answers;
+        # only the cases after them are marked.
+        missing = f"ERROR: {result.stderr.decode('utf-8', 'replace')}"
+    else:
+        missing = f"ERROR: expected {len(json_strs)} outputs, got {len(outputs)}"
+    return outputs + [missing] * (len(json_strs) - len(outputs))
+
+
+def get_go_outputs(json_strs):
+    """Get GLYPH outputs from Go implementation"""
+    try:
+        bin_path = ensure_go_bin()
+    except Exception as exc:
+        return [f"ERROR: {exc}"] * len(json_strs)
+
+    return run_batch([bin_path], json_strs)
+
 
+def get_js_outputs(json_strs):
+    """Get GLYPH outputs from JavaScript implementation"""
+    if not os.path.exists(JS_DIST):
+        return [f"ERROR: {JS_DIST} not found; run `npm run build` in js/"] * len(json_strs)
 
-def get_js_output(json_str):
-    """Get GLYPH output from JavaScript implementation"""
     js_code = f'''
 const {{ fromJsonLoose, canonicalizeLoose }} = require({json.dumps(JS_DIST)});
-const data = JSON.parse({json.dumps(json_str)});
-const v = fromJsonLoose(data);
-console.log(canonicalizeLoose(v));
+const input = require("fs").readFileSync(0);
+const frames = [];
+for (let pos = 0; pos + 4 <= input.length; ) {{
+  const size = input.readUInt32LE(pos);
+  const json = input.toString("utf8", pos + 4, pos + 4 + size);
+  pos += 4 + size;
+  let result;
+  try {{
+    result = canonicalizeLoose(fromJsonLoose(JSON.parse(json)));
+  }} catch (e) {{
+    result = "ERROR: " + e.message;
+  }}
+  const body = Buffer.from(result, "utf8");
+  const head = Buffer.alloc(4);
+  head.writeUInt32LE(body.length);
+  frames.push(head, body);
+}}
+process.stdout.write(Buffer.concat(frames));
 '''
-    result = subprocess.run(
-        ["node", "-e", js_code],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return f"ERROR: {result.stderr}"
-    return result.stdout.strip()
+    return run_batch(["node", "-e", js_code], json_strs)
 
 
-def get_rust_output(json_str):
-    """Get GLYPH output from Rust implementation (parked port — best-effort)"""
+def get_rust_outputs(json_strs):
+    """Get GLYPH outputs from Rust implementation (parked port — best-effort)"""
     try:
         bin_path = ensure_rust_bin()
     except Exception as exc:
-        return f"SKIPPED: {exc}"
+        return [f"SKIPPED: {exc}"] * len(json_strs)
 
     if bin_path is None:
-        return "SKIPPED"
+        return ["SKIPPED"] * len(json_strs)
 
-    result = subprocess.run(
-        [bin_path, json_str],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return f"ERROR: {result.stderr}"
-    return result.stdout
+    return run_batch([bin_path], json_strs)
 
 
-def get_c_output(json_str):
-    """Get GLYPH output from C implementation (parked port — best-effort)"""
+def get_c_outputs(json_strs):
+    """Get GLYPH outputs from C implementation (parked port — best-effort)"""
     try:
         bin_path = ensure_c_bin()
     except Exception as exc:
-        return f"SKIPPED: {exc}"
+        return [f"SKIPPED: {exc}"] * len(json_strs)
 
     if bin_path is None:
-        return "SKIPPED"
+        return ["SKIPPED"] * len(json_strs)
 
-    run_result = subprocess.run(
-        [bin_path, json_str],
-        capture_output=True,
-        text=True,
+    return run_batch(
+        [bin_path],
+        json_strs,
         env={**os.environ, "LD_LIBRARY_PATH": f"{C_DIR}/build"},
     )
-    if run_result.returncode != 0:
-        return f"RUN ERROR: {run_result.stderr}"
-    return run_result.stdout
 
 
 def main():
@@ -329,25 +426,20 @@ def main():
     for desc, json_str, expected in TEST_CASES:
         py_outputs[desc] = get_python_output(json_str)
 
+    descs = [desc for desc, _, _ in TEST_CASES]
+    json_strs = [json_str for _, json_str, _ in TEST_CASES]
+
     print("Getting Go outputs...")
-    go_outputs = {}
-    for desc, json_str, expected in TEST_CASES:
-        go_outputs[desc] = get_go_output(json_str)
+    go_outputs = dict(zip(descs, get_go_outputs(json_strs)))
 
     print("Getting JS outputs...")
-    js_outputs = {}
-    for desc, json_str, expected in TEST_CASES:
-        js_outputs[desc] = get_js_output(json_str)
+    js_outputs = dict(zip(descs, get_js_outputs(json_strs)))
 
     print("Getting Rust outputs (parked port — best-effort)...")
-    rust_outputs = {}
-    for desc, json_str, expected in TEST_CASES:
-        rust_outputs[desc] = get_rust_output(json_str)
+    rust_outputs = dict(zip(descs, get_rust_outputs(json_strs)))
 
     print("Getting C outputs (parked port — best-effort)...")
-    c_outputs = {}
-    for desc, json_str, expected in TEST_CASES:
-        c_outputs[desc] = get_c_output(json_str)
+    c_outputs = dict(zip(descs, get_c_outputs(json_strs)))
 
     print()
     print("=" * 70)
@@ -6,7 +6,6 @@ Comprehensive tests to find data corruption issues like the tabular sparse keys
 Tests JSON -> GLYPH -> JSON round-trip fidelity across edge cases.
 """
 
-import json
 import os
 import sys
 import traceback
@@ -50,9 +49,41 @@ def _normalize_numbers(obj):
     return obj
 
 
-def test_roundtrip(name: str, data: Any, use_tabular: bool = True) -> Tuple[bool, str]:
-    """Test JSON -> GValue -> GLYPH -> GValue -> JSON round-trip."""
+def _deep_equal_json(a, b) -> bool:
+    """Compare two normalized JSON values like their sort_keys dumps would.
+
+    Types must match exactly, so True vs 1 or 1 vs 1.0 still mismatch, and
+    NaN equals NaN as its dumped text does.
+    """
+    if a is b:
+        return True
+    t = type(a)
+    if t is not type(b):
+        return isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)) and \
+            _deep_equal_json(list(a), list(b))
+    if t is dict:
+        return a.keys() == b.keys() and all(_deep_equal_json(v, b[k]) for k, v in a.items())
+    if t is list or t is tuple:
+        return len(a) == len(b) and all(map(_deep_equal_json, a, b))
+    if t is float:
+        return a == b or (a != a and b != b)
+    return a == b
+
+
+_UNSET = object()
+
+
+def test_roundtrip(name: str, data: Any, use_tabular: bool = True,
+                   expected: Any = _UNSET) -> Tuple[bool, str]:
+    """Test JSON -> GValue -> GLYPH -> GValue -> JSON round-trip.
+
+    expected is data already passed through _normalize_numbers, for callers
+    that check the same data more than once.
+    """
     try:
+        if expected is _UNSET:
+            expected = _normalize_numbers(data)
+
         # JSON -> GValue
         gvalue = from_json_loose(data)
 
@@ -66,10 +97,7 @@ def test_roundtrip(name: str, data: Any, use_tabular: bool = True) -> Tuple[bool
         restored = to_json_loose(gvalue)
 
         # Compare on JSON-domain value (see _normalize_numbers).
-        orig_json = json.dumps(_normalize_numbers(data), sort_keys=True, ensure_ascii=False)
-        rest_json = json.dumps(_normalize_numbers(restored), sort_keys=True, ensure_ascii=False)
-
-        if orig_json == rest_json:
+        if _deep_equal_json(expected, _normalize_numbers(restored)):
             return True, f"OK | GLYPH: {glyph_str[:80]}{'...' if len(glyph_str) > 80 else ''}"
         else:
             return False, f"MISMATCH\n  Original: {data}\n  Restored: {restored}\n  GLYPH: {glyph_str}"
@@ -91,10 +119,7 @@ def test_parse_roundtrip(name: str, data: Any) -> Tuple[bool, str]:
         restored = to_json_loose(reparsed)
 
         # Compare on JSON-domain value (see _normalize_numbers).
-        orig_json = json.dumps(_normalize_numbers(data), sort_keys=True, ensure_ascii=False)
-        rest_json = json.dumps(_normalize_numbers(restored), sort_keys=True, ensure_ascii=False)
-
-        if orig_json == rest_json:
+        if _deep_equal_json(_normalize_numbers(data), _normalize_numbers(restored)):
             return True, "OK"
         else:
             return False, f"MISMATCH\n  Original: {data}\n  Restored: {restored}"
@@ -273,8 +298,11 @@ def run_tests():
     errors = []
 
     for name, data in ROUNDTRIP_TESTS:
+        # Both passes compare against the same normalized input.
+        expected = _normalize_numbers(data)
+
         # Test with tabular enabled (default)
-        success, msg = test_roundtrip(name, data, use_tabular=True)
+        success, msg = test_roundtrip(name, data, use_tabular=True, expected=expected)
 
         if success:
             print(f"✅ {name}")
@@ -286,7 +314,8 @@ def run_tests():
             errors.append((name, data, msg))
 
         # Also test without tabular to isolate issues
-        success_no_tab, msg_no_tab = test_roundtrip(f"{name} (no tabular)", data, use_tabular=False)
+        success_no_tab, msg_no_tab = test_roundtrip(f"{name} (no tabular)", data, use_tabular=False,
+                                                      expected=expected)
         if not success_no_tab and success:
             print(f"   ⚠️  Fails WITHOUT tabular too: {msg_no_tab}")
 